@@ -5,6 +5,7 @@ import hashlib
 from pathlib import Path
 from typing import Optional, Dict, Any, List, Union
 from datetime import datetime, timedelta
+from functools import lru_cache
 import logging
 
 # Import from the root config directory (works with sys.path from streamlit_app_modular.py)
@@ -43,6 +44,13 @@ from .models import (
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=256)
+def _cache_path_for(endpoint: str, param_str: str) -> Path:
+    """Cache file path for an endpoint and its canonical (sorted-key JSON) params"""
+    cache_key = hashlib.md5(f"{endpoint}:{param_str}".encode()).hexdigest()
+    return CACHE_DIR / f"{cache_key}.json"
+
+
 class BundestagAPIClient:
     """Client for the German Bundestag DIP API"""
     
@@ -60,10 +68,9 @@ class BundestagAPIClient:
     
     def _get_cache_path(self, endpoint: str, params: Dict[str, Any]) -> Path:
         """Generate cache file path for request"""
-        # Create a hash of the request parameters
-        param_str = json.dumps(params, sort_keys=True)
-        cache_key = hashlib.md5(f"{endpoint}:{param_str}".encode()).hexdigest()
-        return CACHE_DIR / f"{cache_key}.json"
+        # Canonicalize the parameters; the hash and Path are memoized per query
+        # (pagination and reruns repeat the same requests)
+        return _cache_path_for(endpoint, json.dumps(params, sort_keys=True))
     
     def _load_from_cache(self, cache_path: Path) -> Optional[Dict[str, Any]]:
         """Load response from cache if valid"""
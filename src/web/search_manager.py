@@ -8,8 +8,11 @@ import streamlit as st
 import pandas as pd
 import logging
 import sys
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from functools import lru_cache
+from operator import itemgetter
+from typing import Callable, Dict, List, Any, Optional
 import time
 import hashlib
 import asyncio
@@ -58,6 +61,16 @@ except ImportError:
     performance_monitor = DummyOptimizer()
     rerun_optimizer = DummyOptimizer()
 
+# Streamlit fragments (>= 1.33) rerun only their own block on widget interaction;
+# older versions fall back to a plain full-script rerun
+_fragment = getattr(st, "fragment", None) or getattr(st, "experimental_fragment", None) or (lambda func: func)
+
+# Natural title break points: translation tables fold every break character onto
+# ' ' so the scan window needs a single C-level rfind (dashes are multi-byte in
+# UTF-8, so this works on str rather than encoded bytes)
+_TITLE_BREAK_TABLE = str.maketrans(dict.fromkeys('.,;:-–—', ' '))
+_DROPDOWN_BREAK_TABLE = str.maketrans(dict.fromkeys('.,;:', ' '))
+
 
 class SearchManager:
     """Manages search functionality and parameters with enhanced UI and performance optimizations"""
@@ -1354,9 +1367,152 @@ class SearchManager:
     
 
 
+@st.cache_data(max_entries=8, ttl=600, show_spinner=False)
+def _prepare_display_data(search_hash: int, doc_type: str, docs_fingerprint: str,
+                          _documents: List[Dict[str, Any]], _build_frame) -> pd.DataFrame:
+    """Build the results table DataFrame, memoized by Streamlit with automatic eviction.
+
+    Only (search_hash, doc_type, docs_fingerprint) are hashed - the underscore-prefixed
+    arguments are skipped by st.cache_data so the document list is never pickled for hashing.
+    """
+    return _build_frame(_documents, doc_type)
+
+
+def _documents_fingerprint(documents: List[Dict[str, Any]]) -> str:
+    """Cheap content fingerprint of a result list based on the document ids"""
+    return hashlib.md5("|".join(str(d.get('id', '')) for d in documents).encode()).hexdigest()
+
+
+@dataclass(slots=True)
+class DocRow:
+    """Normalized per-document analytics record (attribute access instead of dict.get chains)"""
+    id: str
+    datum: Optional[str]
+    doc_type: str
+    urheber: tuple
+    autor: Optional[str]
+    initiative: Optional[str]
+
+    @classmethod
+    def from_document(cls, doc: Dict[str, Any]) -> "DocRow":
+        """Build a row from a raw API document dict"""
+        urheber = tuple(
+            urh['bezeichnung'] if isinstance(urh, dict) else urh
+            for urh in (doc.get('urheber') or ())
+            if (isinstance(urh, dict) and urh.get('bezeichnung')) or (isinstance(urh, str) and urh)
+        )
+        return cls(
+            id=str(doc.get('id', '')),
+            datum=doc.get('datum') or None,
+            doc_type=doc.get('drucksachetyp') or doc.get('vorgangstyp') or doc.get('aktivitaetsart') or 'Other',
+            urheber=urheber,
+            autor=doc.get('autor') or None,
+            initiative=doc.get('initiative') or None
+        )
+
+    def authors(self) -> tuple:
+        """All author names: urheber followed by autor/initiative"""
+        return self.urheber + tuple(a for a in (self.autor, self.initiative) if a)
+
+
+# Table column builders per document type - resolved once per table, not per row.
+# The needed fields of every document are fetched with one precompiled itemgetter
+# call and transposed into columns (struct-of-arrays), so the table DataFrame is
+# built from columns instead of one dict per row. Raw date strings are truncated
+# column-wise afterwards.
+# NOTE: These builders are deliberately plain Python. A compiled (Cython) port would
+# need a build step, and the app ships as source via requirements.txt/Docker without
+# one; with the C-level itemgetter/zip/str.slice paths above, the remaining per-row
+# work is the author join, which is already memoized.
+def _interned(*keys: str) -> tuple:
+    """Interned field keys - guarantees the pointer-equality fast path in dict lookups"""
+    return tuple(sys.intern(key) for key in keys)
+
+
+_DRUCKSACHE_KEYS = _interned("drucksachetyp", "dokumentnummer", "datum", "urheber", "titel")
+_VORGANG_KEYS = _interned("vorgangstyp", "beratungsstand", "wahlperiode", "urheber", "titel")
+_PLENARPROTOKOLL_KEYS = _interned("dokumentnummer", "datum", "titel")
+_PERSON_KEYS = _interned("vorname", "nachname", "aktualisiert")
+_AKTIVITAET_KEYS = _interned("titel", "datum")
+
+
+def _field_columns(documents: List[Dict[str, Any]], keys: tuple) -> tuple:
+    """Transpose the given keys of all documents into one tuple of values per key"""
+    if not documents:
+        return tuple(() for _ in keys)
+    getter = itemgetter(*keys)
+    
+    def rows():
+        for doc in documents:
+            try:
+                yield getter(doc)
+            except KeyError:
+                # model_dump() emits every field, so this only triggers for hand-built dicts
+                yield tuple(doc.get(key, "") for key in keys)
+    
+    return tuple(zip(*rows()))
+
+
+def _columns_drucksache(documents: List[Dict[str, Any]], get_authors) -> Dict[str, Any]:
+    types, numbers, dates, urheber, titles = _field_columns(documents, _DRUCKSACHE_KEYS)
+    return {"Row": range(1, len(documents) + 1), "Type": types, "Number": numbers,
+            "Date": dates, "Author": [get_authors(u) for u in urheber], "Title": titles}
+
+
+def _columns_vorgang(documents: List[Dict[str, Any]], get_authors) -> Dict[str, Any]:
+    types, statuses, periods, urheber, titles = _field_columns(documents, _VORGANG_KEYS)
+    return {"Row": range(1, len(documents) + 1), "Type": types, "Status": statuses,
+            "Period": periods, "Author": [get_authors(u) for u in urheber], "Title": titles}
+
+
+def _columns_plenarprotokoll(documents: List[Dict[str, Any]], get_authors) -> Dict[str, Any]:
+    numbers, dates, titles = _field_columns(documents, _PLENARPROTOKOLL_KEYS)
+    return {"Row": range(1, len(documents) + 1), "Number": numbers, "Date": dates, "Title": titles}
+
+
+def _columns_person(documents: List[Dict[str, Any]], get_authors) -> Dict[str, Any]:
+    vornamen, nachnamen, dates = _field_columns(documents, _PERSON_KEYS)
+    return {"Row": range(1, len(documents) + 1),
+            "Name": [f"{vorname} {nachname}".strip() for vorname, nachname in zip(vornamen, nachnamen)],
+            "Date": dates}
+
+
+def _columns_aktivitaet(documents: List[Dict[str, Any]], get_authors) -> Dict[str, Any]:
+    titles, dates = _field_columns(documents, _AKTIVITAET_KEYS)
+    return {"Row": range(1, len(documents) + 1), "Title": titles, "Date": dates}
+
+
+# Memoized author join - Drucksachen on a result page mostly share a few sponsoring bodies
+_join_authors = lru_cache(maxsize=256)(", ".join)
+
+
+def _columns_empty(documents: List[Dict[str, Any]], get_authors) -> Dict[str, Any]:
+    """Fallback for unsupported document types: an empty table"""
+    return {}
+
+
+_COLUMN_BUILDERS: Dict[str, Callable[[List[Dict[str, Any]], Callable], Dict[str, Any]]] = {
+    "drucksache": _columns_drucksache,
+    "vorgang": _columns_vorgang,
+    "plenarprotokoll": _columns_plenarprotokoll,
+    "person": _columns_person,
+    "aktivitaet": _columns_aktivitaet,
+}
+
+
+def _iter_selected_indices(mask: int):
+    """Yield the set bit positions of a selection bitmask in ascending order"""
+    while mask:
+        lowest = mask & -mask
+        yield lowest.bit_length() - 1
+        mask ^= lowest
+
+
 class ResultsManager:
     """Manages the display and interaction with search results"""
     
+    _MD_AI_HEADER = "### 🧠 AI Analysis"
+    
     def __init__(self):
         logger.info("Initializing ResultsManager")
         # Import cache manager for proper memory management
@@ -1370,9 +1526,6 @@ class ResultsManager:
         self._cache_manager = get_cache_manager()
         self._session_manager = SessionStateManager()
         
-        # Performance optimization: Use LRU cache instead of unbounded dicts
-        self._display_data_cache = {}  # Will be replaced by cache_manager
-        self._df_cache = {}  # Will be replaced by cache_manager
         # CSS cache to avoid repeated injection
         self._css_injected = False
         # PERFORMANCE: Add timing metrics
@@ -1649,25 +1802,13 @@ class ResultsManager:
         
         # Initialize selection state efficiently
         if selection_key not in st.session_state:
-            st.session_state[selection_key] = set()
-        
-        # PERFORMANCE OPTIMIZATION: Cache both display data and DataFrame
-        data_cache_key = f"display_data_{table_key}"
-        df_cache_key = f"cached_df_{table_key}"
+            st.session_state[selection_key] = 0  # Bitmask of selected row indices
         
-        # Only prepare display data if not cached
-        if data_cache_key not in st.session_state:
-            display_data = self._prepare_display_data(documents, doc_type)
-            st.session_state[data_cache_key] = display_data
-        else:
-            display_data = st.session_state[data_cache_key]
-        
-        # Only create DataFrame if not cached
-        if df_cache_key not in st.session_state:
-            df = pd.DataFrame(display_data)
-            st.session_state[df_cache_key] = df
-        else:
-            df = st.session_state[df_cache_key]
+        # PERFORMANCE OPTIMIZATION: DataFrame is memoized by st.cache_data (bounded, with TTL)
+        df = _prepare_display_data(
+            search_hash, doc_type, _documents_fingerprint(documents),
+            documents, self._create_optimized_display_data
+        )
         
         if not df.empty:
             result = self._display_modern_table(df, documents, table_key, selection_key)
@@ -1701,18 +1842,18 @@ class ResultsManager:
         
         # Initialize selection state
         if selection_key not in st.session_state:
-            st.session_state[selection_key] = set()
+            st.session_state[selection_key] = 0  # Bitmask of selected row indices
         
         current_selections = st.session_state[selection_key]
         
         # Pagination for performance - upgraded to 1000 records
         if total_rows > 1000:
             start_idx, end_idx = BrowserOptimizations.create_pagination_controls(total_rows, items_per_page=1000)
-            df_display = df.iloc[start_idx:end_idx].copy()
+            df_display = df.iloc[start_idx:end_idx]
             documents_display = documents[start_idx:end_idx]
             page_offset = start_idx
         else:
-            df_display = df.copy()
+            df_display = df
             documents_display = documents
             page_offset = 0
         
@@ -1723,7 +1864,7 @@ class ResultsManager:
         st.caption(f"📋 Select documents ({total_rows} total, {len(df_display)} shown)")
         
         # Show selected count
-        selected_count = len(current_selections)
+        selected_count = current_selections.bit_count()
         if selected_count > 0:
             st.info(f"✅ {selected_count} document(s) selected")
         
@@ -1734,17 +1875,16 @@ class ResultsManager:
             self._css_injected = True
         
         # Display enhanced table with tooltips and better title handling
-        display_df = df_display.copy()
-        
-        # Store original titles for tooltips and create smart truncation
-        if 'Title' in display_df.columns:
-            original_titles = display_df['Title'].astype(str)
-            # Smart truncation - keep more text for titles, truncate intelligently
-            display_df['Title'] = original_titles.apply(self._smart_truncate_title)
-            
-        if 'Author' in display_df.columns:
-            # Smart author truncation - only truncate if necessary
-            display_df['Author'] = display_df['Author'].astype(str).apply(lambda x: self._smart_truncate_author(x))
+        # PERFORMANCE: assign() returns a new frame that reuses the untouched column
+        # arrays by reference - the cached df is never copied or mutated
+        truncators = {
+            'Title': self._smart_truncate_title,  # keep more text for titles, truncate intelligently
+            'Author': self._smart_truncate_author  # only truncate if necessary
+        }
+        display_df = df_display.assign(**{
+            col: df_display[col].astype(str).map(truncate)
+            for col, truncate in truncators.items() if col in df_display.columns
+        })
         
         # Display table with click-to-expand functionality for long titles
         with st.expander("📋 Search Results Table", expanded=True):
@@ -1780,6 +1920,17 @@ class ResultsManager:
         
         # Performance-optimized analytics with lazy loading
         if documents and len(documents) > 0:
+            # PERFORMANCE: Normalize documents into slotted rows once per result set,
+            # keyed on the result fingerprint so a same-size re-search is not served stale rows
+            rows_key = f"doc_rows_{table_key}"
+            fingerprint = _documents_fingerprint(documents)
+            cached = st.session_state.get(rows_key)
+            if cached is not None and cached[0] == fingerprint:
+                rows = cached[1]
+            else:
+                rows = [DocRow.from_document(doc) for doc in documents]
+                st.session_state[rows_key] = (fingerprint, rows)
+            
             # Quick metrics (minimal DOM impact)
             col1, col2, col3, col4 = st.columns(4)
             
@@ -1788,33 +1939,22 @@ class ResultsManager:
             
             with col2:
                 # Efficient date counting using generator expression
-                dated_count = sum(1 for doc in documents if doc.get('datum'))
+                dated_count = sum(1 for row in rows if row.datum)
                 st.metric("With Dates", f"{dated_count:,}")
             
             with col3:
                 # Memory-efficient author counting
                 authors = set()
-                for doc in documents[:100]:  # Limit to first 100 for performance
-                    urheber = doc.get('urheber', [])
-                    if urheber:
-                        for urh in urheber:
-                            if isinstance(urh, dict) and urh.get('bezeichnung'):
-                                authors.add(urh['bezeichnung'])
-                            elif isinstance(urh, str):
-                                authors.add(urh)
-                    # Check other author fields
-                    for field in ['autor', 'initiative']:
-                        if doc.get(field):
-                            authors.add(doc.get(field))
+                for row in rows[:100]:  # Limit to first 100 for performance
+                    authors.update(row.authors())
                 suffix = "+" if len(documents) > 100 else ""
                 st.metric("Unique Authors", f"{len(authors)}{suffix}")
             
             with col4:
                 # Efficient time range calculation
-                dates = [doc.get('datum') for doc in documents[:100] if doc.get('datum')]
+                dates = [row.datum for row in rows[:100] if row.datum]
                 if dates:
                     try:
-                        import pandas as pd
                         parsed_dates = pd.to_datetime(dates, errors='coerce').dropna()
                         if not parsed_dates.empty:
                             time_span = (parsed_dates.max() - parsed_dates.min()).days
@@ -1842,28 +1982,22 @@ class ResultsManager:
                 if analytics_type == "Document Types":
                     # Efficient document type analysis
                     type_map = {}
-                    for doc in documents[:500]:  # Limit for performance
-                        doc_type = (doc.get('drucksachetyp') or 
-                                   doc.get('vorgangstyp') or 
-                                   doc.get('aktivitaetsart') or 'Other')
-                        type_map[doc_type] = type_map.get(doc_type, 0) + 1
+                    for row in rows[:500]:  # Limit for performance
+                        type_map[row.doc_type] = type_map.get(row.doc_type, 0) + 1
                     
                     if type_map:
                         # Lightweight bar chart
-                        import pandas as pd
-                        df = pd.DataFrame(list(type_map.items()), columns=['Type', 'Count'])
-                        df = df.sort_values('Count', ascending=True).tail(8)  # Top 8 for readability
+                        top_types = pd.Series(type_map, name='Count').nlargest(8).sort_values()  # Top 8 for readability
                         
-                        st.bar_chart(df.set_index('Type')['Count'])
+                        st.bar_chart(top_types)
                         
                         if len(documents) > 500:
                             st.caption("📊 Analysis based on sample of 500 documents for optimal performance")
                 
                 elif analytics_type == "Temporal Distribution":
-                    dates = [doc.get('datum') for doc in documents[:300] if doc.get('datum')]
+                    dates = [row.datum for row in rows[:300] if row.datum]
                     if dates:
                         try:
-                            import pandas as pd
                             df = pd.DataFrame({'date': pd.to_datetime(dates, errors='coerce')})
                             df = df.dropna()
                             
@@ -1887,35 +2021,15 @@ class ResultsManager:
                 elif analytics_type == "Author Analysis":
                     # Efficient author analysis with sampling
                     author_counts = {}
-                    for doc in documents[:200]:  # Sample for performance
-                        authors = []
-                        
-                        # Extract authors efficiently
-                        urheber = doc.get('urheber', [])
-                        if urheber:
-                            for urh in urheber:
-                                if isinstance(urh, dict) and urh.get('bezeichnung'):
-                                    authors.append(urh['bezeichnung'])
-                                elif isinstance(urh, str):
-                                    authors.append(urh)
-                        
-                        # Add other author fields
-                        for field in ['autor', 'initiative']:
-                            if doc.get(field):
-                                authors.append(doc.get(field))
-                        
-                        # Count authors
-                        for author in authors:
-                            if author:
-                                author_counts[author] = author_counts.get(author, 0) + 1
+                    for row in rows[:200]:  # Sample for performance
+                        for author in row.authors():
+                            author_counts[author] = author_counts.get(author, 0) + 1
                     
                     if author_counts:
                         # Show top 10 authors
-                        import pandas as pd
-                        df = pd.DataFrame(list(author_counts.items()), columns=['Author', 'Count'])
-                        top_authors = df.nlargest(10, 'Count')
+                        top_authors = pd.Series(author_counts, name='Count').nlargest(10)
                         
-                        st.bar_chart(top_authors.set_index('Author')['Count'])
+                        st.bar_chart(top_authors)
                         
                         if len(documents) > 200:
                             st.caption("📊 Analysis based on sample of 200 documents for optimal performance")
@@ -1934,10 +2048,10 @@ class ResultsManager:
             self._display_document_selection_interface(documents_display, page_offset, selection_key)
             
             # Get current selections from session state
-            current_selections = st.session_state.get(selection_key, set())
+            current_selections = st.session_state.get(selection_key, 0)
             
             # Get selected documents to return
-            selected_documents = [documents[i] for i in current_selections if i < len(documents)]
+            selected_documents = [documents[i] for i in _iter_selected_indices(current_selections) if i < len(documents)]
             
         
         # Always return selected documents (empty list if none selected)
@@ -1946,7 +2060,7 @@ class ResultsManager:
     
     def _display_document_selection_interface(self, documents_display, page_offset, selection_key):
         """Display the document selection interface below the table"""
-        current_selections = st.session_state.get(selection_key, set())
+        current_selections = st.session_state.get(selection_key, 0)
         
         with st.container():
             st.write("Select documents for analysis:")
@@ -1973,7 +2087,7 @@ class ResultsManager:
                     doc_type_info = doc.get('aktivitaetsart', '')
                 
                 # Get author/urheber information
-                author_info = self._safe_get_authors(doc)
+                author_info = self._authors(doc.get('urheber'))
                 if not author_info:
                     # Fallback to other author fields
                     author_info = doc.get('autor', doc.get('initiative', ''))
@@ -2069,7 +2183,7 @@ class ResultsManager:
             # Default selections
             default_selections = [
                 opt for opt, idx in option_map.items() 
-                if idx in current_selections
+                if current_selections >> idx & 1
             ]
             
             # Enhanced multiselect with full width
@@ -2082,16 +2196,14 @@ class ResultsManager:
             )
             
             # Update selection state
-            new_selections = set(current_selections)
-            
-            # Remove current page selections
-            page_indices = set(range(page_offset, page_offset + len(documents_display)))
-            new_selections = new_selections - page_indices
+            # PERFORMANCE: Selections are an int bitmask - clearing the page is one mask op
+            page_mask = ((1 << len(documents_display)) - 1) << page_offset
+            new_selections = current_selections & ~page_mask
             
             # Add new selections from current page
             for option in selected_options:
                 if option in option_map:
-                    new_selections.add(option_map[option])
+                    new_selections |= 1 << option_map[option]
             
             st.session_state[selection_key] = new_selections
     
@@ -2102,8 +2214,8 @@ class ResultsManager:
         
         for key in list(st.session_state.keys()):
             # More aggressive cleanup patterns
-            if (key.startswith(("search_table_", "selected_docs_", "cached_df_", 
-                               "table_data_", "display_df_", "column_config_", "display_data_")) 
+            if (key.startswith(("search_table_", "selected_docs_", "doc_rows_",
+                               "table_data_", "display_df_", "column_config_")) 
                 and key != current_table_key 
                 and not key.endswith(current_hash)):
                 keys_to_remove.append(key)
@@ -2111,147 +2223,46 @@ class ResultsManager:
         # PERFORMANCE: Batch removal to reduce session state operations
         for key in keys_to_remove:
             st.session_state.pop(key, None)  # Use pop to avoid KeyError
-        
-        # PERFORMANCE: Clear display data cache if it gets too large
-        if len(self._display_data_cache) > 3:
-            self._display_data_cache.clear()
-    
-    def _prepare_display_data(self, documents: List[Dict[str, Any]], doc_type: str) -> List[Dict[str, Any]]:
-        """Prepare documents data for display in the table - OPTIMIZED"""
-        # PERFORMANCE OPTIMIZATION: Use LRU cache with automatic eviction
-        cache_key = self._cache_manager.get_cache_key(
-            doc_type, len(documents), [d.get('id', '') for d in documents[:3]]
-        )
-        
-        cached_data = self._cache_manager.display_cache.get(cache_key)
-        if cached_data:
-            self._performance_metrics['cache_hits'] += 1
-            return cached_data
-        
-        self._performance_metrics['cache_misses'] += 1
-        
-        # PERFORMANCE: Use list comprehension with minimal dict operations
-        display_data = self._create_optimized_display_data(documents, doc_type)
-        
-        # Cache the result for future use
-        # Store in LRU cache with automatic eviction
-        self._cache_manager.display_cache.set(cache_key, display_data)
-        
-        # PERFORMANCE: Limit cache size more aggressively
-        # Cache management is now handled by LRU cache automatically
-        # No need for manual eviction
-        
-        return display_data
     
-    def _safe_get_authors(self, doc: Dict[str, Any]) -> str:
-        """Safely extract author names from urheber field"""
-        urheber = doc.get("urheber")
-        if not urheber:
-            return ""
-        
-        if not isinstance(urheber, (list, tuple)):
-            return ""
-            
-        authors = []
-        for u in urheber:
-            if isinstance(u, dict) and u.get("bezeichnung"):
-                authors.append(u["bezeichnung"])
-        
-        return ", ".join(authors)
+    @staticmethod
+    def _authors(urheber) -> str:
+        """Comma-joined bezeichnung values of an urheber list (non-dict entries are skipped)"""
+        # PERFORMANCE: Keyed by the name tuple - many documents share the same sponsors
+        return _join_authors(tuple(
+            b for u in (urheber or ()) if (b := (u.get("bezeichnung") if hasattr(u, "get") else None))
+        ))
 
-    def _create_optimized_display_data(self, documents: List[Dict[str, Any]], doc_type: str) -> List[Dict[str, Any]]:
-        """ULTRA-PERFORMANCE OPTIMIZED: Use generator for memory efficiency"""
+    def _create_optimized_display_data(self, documents: List[Dict[str, Any]], doc_type: str) -> pd.DataFrame:
+        """
+        ULTRA-PERFORMANCE OPTIMIZED: Build the table DataFrame from column lists (no per-row dicts)
         
-        def generate_display_data():
-            """Generator function for memory-efficient processing"""
-            if doc_type == "drucksache":
-                for i, doc in enumerate(documents):
-                    yield {
-                        "Row": i + 1,
-                        "Type": doc.get("drucksachetyp", ""),
-                        "Number": doc.get("dokumentnummer", ""),
-                        "Date": doc.get("datum", "")[:10] if doc.get("datum") else "",
-                        "Author": self._safe_get_authors(doc),
-                        "Title": doc.get("titel", "")
-                    }
-            elif doc_type == "vorgang":
-                for i, doc in enumerate(documents):
-                    yield {
-                        "Row": i + 1,
-                        "Type": doc.get("vorgangstyp", ""),
-                        "Status": doc.get("beratungsstand", ""),
-                        "Period": doc.get("wahlperiode", ""),
-                        "Author": self._safe_get_authors(doc),
-                        "Title": doc.get("titel", "")
-                    }
-            elif doc_type == "plenarprotokoll":
-                for i, doc in enumerate(documents):
-                    yield {
-                        "Row": i + 1,
-                        "Number": doc.get("dokumentnummer", ""),
-                        "Date": doc.get("datum", "")[:10] if doc.get("datum") else "",
-                        "Title": doc.get("titel", "")
-                    }
-            elif doc_type == "person":
-                for i, doc in enumerate(documents):
-                    yield {
-                        "Row": i + 1,
-                        "Name": f"{doc.get('vorname', '')} {doc.get('nachname', '')}".strip(),
-                        "Date": doc.get("aktualisiert", "")[:10] if doc.get("aktualisiert") else ""
-                    }
-            elif doc_type == "aktivitaet":
-                for i, doc in enumerate(documents):
-                    yield {
-                        "Row": i + 1,
-                        "Title": doc.get("titel", ""),
-                        "Date": doc.get("datum", "")[:10] if doc.get("datum") else ""
-                    }
-        
-        # PERFORMANCE: Process generator in batches for large datasets
-        if len(documents) > 100:
-            # Use batched processing for large datasets
-            result = []
-            batch_size = 50
-            for batch_start in range(0, len(documents), batch_size):
-                batch_end = min(batch_start + batch_size, len(documents))
-                batch_docs = documents[batch_start:batch_end]
-                # Process batch
-                for item in generate_display_data():
-                    result.append(item)
-                    if len(result) >= batch_end:
-                        break
-            return result
-        else:
-            # Convert generator to list for small datasets
-            return list(generate_display_data())
+        Do not decorate this or the column builders with Numba's @njit: the workload is
+        string + dict I/O, not numeric arrays, so Numba falls back to object mode and its
+        typed dicts are slower than CPython's. See the note above the column builders for
+        the compiled-extension option. Reruns are served by the st.cache_data layer
+        around the caller, so no extra memoization happens here.
+        """
+        columns = _COLUMN_BUILDERS.get(doc_type, _columns_empty)(documents, self._authors)
+        if "Date" in columns:
+            # Vectorized YYYY-MM-DD truncation in pandas' string kernel instead of per-row slicing
+            columns["Date"] = pd.Series(columns["Date"], dtype="string").str.slice(0, 10).fillna("")
+        return pd.DataFrame(columns, copy=False)
     
     def _show_performance_metrics(self):
         """Display performance metrics for debugging"""
         # Performance metrics removed for cleaner UI
         pass
     
-    def _extract_urheber_bezeichnung(self, urheber_list: List[Dict[str, Any]]) -> str:
-        """Extract bezeichnung from urheber list"""
-        if not urheber_list:
-            return ""
-        
-        # Get all bezeichnung values from the urheber list
-        bezeichnungen = []
-        for urheber in urheber_list:
-            if isinstance(urheber, dict) and urheber.get("bezeichnung"):
-                bezeichnungen.append(urheber["bezeichnung"])
-        
-        # Join multiple bezeichnungen with commas
-        return ", ".join(bezeichnungen) if bezeichnungen else ""
-    
     def _truncate_title(self, title: str, max_length: int = 100) -> str:
         """Truncate title if too long"""
         if len(title) > max_length:
             return title[:max_length] + "..."
         return title
     
-    def _smart_truncate_title(self, title: str, max_length: int = 120) -> str:
-        """Enhanced smart truncation for table display - preserves key information"""
+    @staticmethod
+    @lru_cache(maxsize=2048)
+    def _smart_truncate_title(title: str, max_length: int = 120) -> str:
+        """Enhanced smart truncation for table display - preserves key information (memoized across reruns)"""
         if not title or len(title) <= max_length:
             return title
         
@@ -2261,10 +2272,10 @@ class ResultsManager:
             truncate_pos = max_length
             
             # Look backward for natural break points
-            for i in range(min(max_length, len(title)) - 1, max(0, max_length - 20), -1):
-                if title[i] in '.,;:-–— ':
-                    truncate_pos = i + 1
-                    break
+            start, end = max(0, max_length - 20) + 1, min(max_length, len(title))
+            pos = title[start:end].translate(_TITLE_BREAK_TABLE).rfind(' ')
+            if pos >= 0:
+                truncate_pos = start + pos + 1
             
             # Ensure we don't truncate too early
             if truncate_pos < max_length * 0.7:
@@ -2284,10 +2295,10 @@ class ResultsManager:
         truncate_pos = max_length
         
         # Look for break points in the latter part first
-        for i in range(min(max_length - 5, len(title)), max(max_length - 25, 0), -1):
-            if title[i] in '.,;: ':
-                truncate_pos = i + 1
-                break
+        start, end = max(max_length - 25, 0) + 1, min(max_length - 5, len(title)) + 1
+        pos = title[start:end].translate(_DROPDOWN_BREAK_TABLE).rfind(' ')
+        if pos >= 0:
+            truncate_pos = start + pos + 1
         
         return title[:truncate_pos].rstrip() + "..."
     
@@ -2330,28 +2341,6 @@ class ResultsManager:
             # Single author, simple truncation
             return author[:max_length-3] + "..." if len(author) > max_length else author
     
-    def _fast_extract_urheber(self, urheber_list: List[Dict[str, Any]]) -> str:
-        """Fast optimized urheber extraction"""
-        if not urheber_list:
-            return ""
-        
-        # Use list comprehension for better performance
-        bezeichnungen = [u.get("bezeichnung", "") for u in urheber_list if isinstance(u, dict) and u.get("bezeichnung")]
-        return ", ".join(bezeichnungen)
-    
-    def _fast_format_date(self, date_str: str) -> str:
-        """Fast date formatting without heavy imports"""
-        if not date_str:
-            return ""
-        # Simple date formatting - avoid heavy datetime operations
-        return date_str[:10] if len(date_str) >= 10 else date_str
-    
-    def _fast_truncate_title(self, title: str, max_length: int = 100) -> str:
-        """Fast title truncation"""
-        if not title:
-            return ""
-        return title[:max_length] + "..." if len(title) > max_length else title
-    
     def display_action_buttons(self, selected_documents: List[Dict[str, Any]], doc_type: str, 
                              openai_available: bool = False) -> Dict[str, bool]:
         """PERFORMANCE: Streamlined action buttons without CSS bloat"""
@@ -2366,29 +2355,24 @@ class ResultsManager:
         button_states = {}
         
         # PERFORMANCE: Simple AI analysis section without CSS bloat
-        st.markdown("### 🧠 AI Analysis")
+        st.markdown(self._MD_AI_HEADER)
+        
+        # One button registration for both states - disabled when OpenAI is not configured
+        # (a disabled st.button always returns False)
+        button_states['get_summaries_streaming'] = st.button(
+            "🧠 Start AI Analysis",
+            key="get_summaries_streaming",
+            type="primary",
+            use_container_width=True,
+            disabled=not openai_available,
+            help=("Generate AI summaries and citizen impact analysis" if openai_available
+                  else "AI analysis requires OpenAI configuration")
+        )
         
         if openai_available:
-            button_states['get_summaries_streaming'] = st.button(
-                "🧠 Start AI Analysis",
-                key="get_summaries_streaming",
-                type="primary",
-                use_container_width=True,
-                help="Generate AI summaries and citizen impact analysis"
-            )
-            
             st.info("📝 Generate AI-powered document analysis and insights")
             
         else:
-            st.button(
-                "🧠 Start AI Analysis", 
-                key="get_summaries_streaming", 
-                disabled=True,
-                type="primary",
-                use_container_width=True,
-                help="AI analysis requires OpenAI configuration"
-            )
-            
             # Get more specific error information
             openai_status = st.session_state.get('openai_status', 'not_initialized')
             if 'error:' in str(openai_status):
@@ -2396,8 +2380,6 @@ class ResultsManager:
                 st.warning(f"⚙️ OpenAI integration not available: {error_details}")
             else:
                 st.warning("⚙️ OpenAI integration not available. Please configure your API key.")
-            
-            button_states['get_summaries_streaming'] = False
         
         return button_states
     
@@ -2413,6 +2395,7 @@ class ResultsManager:
             st.markdown("### 🧠 AI Analysis Results")
             self._display_ai_summaries_lazy()
     
+    @_fragment
     def _display_ai_summaries_lazy(self):
         """PERFORMANCE: Lazy load AI summaries to prevent browser freezing"""
         summaries = st.session_state.get('document_summaries', {})
@@ -2421,40 +2404,69 @@ class ResultsManager:
             st.info("🧠 No AI summaries available yet. Select documents and generate summaries using the action buttons.")
             return
         
-        # PERFORMANCE: Limit display and use expanders to prevent DOM overload
+        # PERFORMANCE: Limit display and use a single table to prevent DOM overload
         st.markdown(f"**🧠 AI-Generated Summaries ({len(summaries)}):**")
         
         # PERFORMANCE: Only show first 5 summaries by default to prevent DOM bloat
         display_limit = 5
-        summary_items = list(summaries.items())
+        summary_keys = list(summaries)
+        
+        if len(summary_keys) > display_limit:
+            st.warning(f"⚠️ Showing {display_limit} of {len(summary_keys)} summaries for optimal performance.")
+        
+        # PERFORMANCE: One overview table + one selectbox instead of an expander and
+        # button per summary - only the selected summary's text is rendered
+        shown_items = [(doc_id, summaries[doc_id]) for doc_id in summary_keys[:display_limit]]
+        
+        # PERFORMANCE: Rebuild the overview only when a shown summary actually changed -
+        # tracked via (doc_id, hash(summary)) pairs in session_state
+        summary_hashes = tuple((doc_id, hash(summary_data.get('summary', ''))) for doc_id, summary_data in shown_items)
+        if st.session_state.get('_summary_hashes') != summary_hashes:
+            titles = {
+                doc_id: summary_data.get('document', {}).get('titel', f'Document {doc_id}')
+                for doc_id, summary_data in shown_items
+            }
+            st.session_state['_summary_titles'] = titles
+            st.session_state['_summary_overview_df'] = pd.DataFrame(
+                {"Title": list(titles.values()), "DocID": list(titles.keys())}
+            )
+            st.session_state['_summary_hashes'] = summary_hashes
+        titles = st.session_state['_summary_titles']
         
-        if len(summary_items) > display_limit:
-            st.warning(f"⚠️ Showing {display_limit} of {len(summary_items)} summaries for optimal performance.")
-            display_limit = len(summary_items)  # Show all summaries
+        st.dataframe(
+            st.session_state['_summary_overview_df'],
+            use_container_width=True,
+            hide_index=True
+        )
         
-        for i, (doc_id, summary_data) in enumerate(summary_items[:display_limit]):
-            # PERFORMANCE: Use expanders to prevent all content loading at once
-            title = summary_data.get('document', {}).get('titel', f'Document {doc_id}')
-            title = title[:50] + "..." if len(title) > 50 else title
-            
-            with st.expander(f"📄 {title}", expanded=False):
-                summary_text = summary_data.get('summary', 'No summary available')
-                if len(summary_text) > 1000:
-                    # PERFORMANCE: Truncate very long summaries
-                    st.write(summary_text[:1000] + "...")
-                    if st.button(f"Show full summary", key=f"expand_summary_{doc_id}"):
-                        st.write(summary_text)
-                else:
-                    st.write(summary_text)
-                
-                # PERFORMANCE: Only show citizen impact if available and not too long
-                citizen_impact = summary_data.get('citizen_impact')
-                if citizen_impact and len(citizen_impact) < 500:
-                    st.markdown("**🏛️ Citizen Impact:**")
-                    st.write(citizen_impact)
-                elif citizen_impact:
-                    st.markdown("**🏛️ Citizen Impact:**")
-                    st.write(citizen_impact[:300] + "...")
+        selected_doc_id = st.selectbox(
+            "Details for",
+            options=list(titles.keys()),
+            format_func=lambda doc_id: titles[doc_id][:80] + "..." if len(titles[doc_id]) > 80 else titles[doc_id],
+            key="ai_summary_detail_select"
+        )
+        if selected_doc_id is None:
+            return
+        
+        summary_data = summaries[selected_doc_id]
+        st.markdown(f"**📄 {titles[selected_doc_id]}**")
+        summary_text = summary_data.get('summary', 'No summary available')
+        if len(summary_text) > 1000:
+            # PERFORMANCE: Truncate very long summaries
+            st.write(summary_text[:1000] + "...")
+            if st.button(f"Show full summary", key=f"expand_summary_{selected_doc_id}"):
+                st.write(summary_text)
+        else:
+            st.write(summary_text)
+        
+        # PERFORMANCE: Only show citizen impact if available and not too long
+        citizen_impact = summary_data.get('citizen_impact')
+        if citizen_impact and len(citizen_impact) < 500:
+            st.markdown("**🏛️ Citizen Impact:**")
+            st.write(citizen_impact)
+        elif citizen_impact:
+            st.markdown("**🏛️ Citizen Impact:**")
+            st.write(citizen_impact[:300] + "...")
     
     
     # Remove the old method
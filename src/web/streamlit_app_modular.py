@@ -5,56 +5,45 @@ Enhanced with security features and input validation.
 """
 
 import streamlit as st
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+import asyncio
+import importlib
 import sys
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from functools import cached_property
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 
-# ⚡ PERFORMANCE: Lazy imports for faster startup
-def lazy_import_pandas():
-    import pandas as pd
-    return pd
-
-def lazy_import_plotly():
-    import plotly.express as px
-    return px
-
-def lazy_import_asyncio():
-    import asyncio
-    return asyncio
-
-def lazy_import_datetime():
-    from datetime import datetime
-    return datetime
-
-def lazy_import_json():
-    import json
-    return json
-
-def lazy_import_time():
-    import time
-    return time
-
-def lazy_import_random():
-    import random
-    return random
-
 # Add the project root to the Python path
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
-# ⚡ PERFORMANCE: Lazy imports for heavy modules
-def lazy_import_api_client():
-    from src.api.client import BundestagAPIClient
-    return BundestagAPIClient
+# ⚡ PERFORMANCE: Heavy modules are imported on first use by _lazy() and cached in
+# globals(), so every later lookup is a plain dict hit. Stdlib modules above are
+# cheap (and already loaded by Streamlit), so they are imported eagerly.
+_LAZY_IMPORTS = {
+    'pd': ('pandas', None),
+    'px': ('plotly.express', None),
+    'BundestagAPIClient': ('src.api.client', 'BundestagAPIClient'),
+    'validate_environment_security': ('src.security', 'validate_environment_security'),
+}
 
-def lazy_import_helpers():
-    from src.utils.helpers import format_date
-    return format_date
 
-def lazy_import_security():
-    from src.security import validate_environment_security, SecurityMonitor
-    return validate_environment_security, SecurityMonitor
+def _lazy(name: str):
+    """Import a lazily loaded name on first use and cache it in the module globals"""
+    try:
+        return globals()[name]
+    except KeyError:
+        pass
+    module_name, attr = _LAZY_IMPORTS[name]
+    value = importlib.import_module(module_name)
+    if attr:
+        value = getattr(value, attr)
+    globals()[name] = value
+    return value
 
 # Import our modular components
 try:
@@ -94,6 +83,65 @@ except ImportError:
             def create_pagination_controls(total_items, items_per_page=1000): return (0, min(total_items, items_per_page))
 
 
+@st.cache_data(show_spinner=False)
+def _load_docs(path: str, mtime: float) -> str:
+    """Read a documentation markdown file; cached per path and modification time"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+def _inject_doc_page_css():
+    """Inject the scroll/header fixes shared by the documentation pages"""
+    st.markdown(_DOC_PAGE_CSS, unsafe_allow_html=True)
+
+
+# ⚡ PERFORMANCE: App and documentation-page CSS live in static/ and are read once at import
+_APP_STYLE = f"<style>{(Path(__file__).parent / 'static' / 'app.css').read_text(encoding='utf-8')}</style>"
+_DOC_PAGE_CSS = f"<style>{(Path(__file__).parent / 'static' / 'docs.css').read_text(encoding='utf-8')}</style>"
+
+
+@st.cache_resource(show_spinner=False)
+def _create_openai_handler(api_key: str) -> "OpenAIHandler":
+    """Construct the OpenAI handler once per API key and share it across reruns"""
+    return OpenAIHandler(api_key)
+
+
+@st.cache_resource(show_spinner=False)
+def _get_api_client():
+    """Construct the Bundestag API client once and share it across reruns"""
+    return _lazy('BundestagAPIClient')()
+
+
+class _SearchFailed(Exception):
+    """Raised inside _cached_search so that failed searches are not cached"""
+
+
+@st.cache_data(ttl=600, show_spinner=False)
+def _cached_search(_results_manager, doc_type: str, filters_items: tuple, limit: int) -> Dict[str, Any]:
+    """Run a search once per (doc_type, filters, limit) for 10 minutes.
+
+    The API client is not part of the cached value (it is not picklable); callers
+    re-attach their own client to the returned copy.
+    """
+    results = _results_manager.perform_search(_get_api_client(), doc_type, dict(filters_items), limit)
+    if results is None:
+        raise _SearchFailed(doc_type)
+    results.pop("api_client", None)
+    return results
+
+
+_SessionStateManager = None
+
+
+def _get_session_state_manager():
+    """Import SessionStateManager on first use and keep it in a module global"""
+    global _SessionStateManager
+    if _SessionStateManager is None:
+        from src.web.cache_manager import SessionStateManager
+        _SessionStateManager = SessionStateManager
+    return _SessionStateManager
+
+
 class BundestagStreamlitApp:
     """Main Streamlit application for Bundestag.AI Lens"""
     
@@ -102,73 +150,46 @@ class BundestagStreamlitApp:
         # Defer security checks until first interaction
         self._security_checked = False
         
-        # Lazy-loaded components
+        # Clients (created on demand)
         self.api_client = None
         self.openai_handler = None
-        self._performance_monitor = None
-        self._summary_display = None
-        self._analytics_display = None
-        self._search_manager = None
-        self._results_manager = None
         
         # Fast startup initialization only
         self.init_session_state()
         self.setup_clients()  # Initialize client status
         self.configure_page_minimal()
-        
-        # Mark that components need initialization when accessed
-        self._components_loaded = False
     
     def ensure_security_check(self):
         """Check security only when needed"""
         if not self._security_checked:
-            validate_func, _ = lazy_import_security()
+            validate_func = _lazy('validate_environment_security')
             security_issues = validate_func()
             if security_issues:
                 for issue in security_issues:
                     st.warning(f"🔐 Security: {issue}")
             self._security_checked = True
     
-    def ensure_components_loaded(self):
-        """Load components only when first accessed"""
-        if not self._components_loaded:
-            self._performance_monitor = PerformanceMonitor()
-            self._summary_display = SummaryDisplayManager()
-            self._analytics_display = AnalyticsDisplayManager()
-            self._search_manager = SearchManager()
-            self._results_manager = ResultsManager()
-            self._components_loaded = True
-    
-    # Property accessors for lazy loading
-    @property
+    # Lazy-loaded components: cached_property stores each instance in __dict__ on
+    # first access, so later accesses are plain attribute lookups
+    @cached_property
     def performance_monitor(self):
-        if self._performance_monitor is None:
-            self._performance_monitor = PerformanceMonitor()
-        return self._performance_monitor
+        return PerformanceMonitor()
     
-    @property
+    @cached_property
     def summary_display(self):
-        if self._summary_display is None:
-            self._summary_display = SummaryDisplayManager()
-        return self._summary_display
+        return SummaryDisplayManager()
     
-    @property
+    @cached_property
     def analytics_display(self):
-        if self._analytics_display is None:
-            self._analytics_display = AnalyticsDisplayManager()
-        return self._analytics_display
+        return AnalyticsDisplayManager()
     
-    @property
+    @cached_property
     def search_manager(self):
-        if self._search_manager is None:
-            self._search_manager = SearchManager()
-        return self._search_manager
+        return SearchManager()
     
-    @property
+    @cached_property
     def results_manager(self):
-        if self._results_manager is None:
-            self._results_manager = ResultsManager()
-        return self._results_manager
+        return ResultsManager()
     
     def configure_page_minimal(self):
         """⚡ Minimal page configuration for fast startup"""
@@ -204,44 +225,27 @@ class BundestagStreamlitApp:
                 # Continue without performance CSS
             
             # Essential CSS only
-            st.markdown("""
-            <style>
-                .main-header {
-                    font-size: 2.2rem;
-                    color: #1f77b4;
-                    text-align: center;
-                    margin-bottom: 1.5rem;
-                }
-                .stButton > button {
-                    background-color: #1f77b4;
-                    color: white;
-                    border: none;
-                    border-radius: 5px;
-                    padding: 0.4rem 1.5rem;
-                }
-                .stButton > button:hover {
-                    background-color: #155a8a;
-                }
-            </style>
-            """, unsafe_allow_html=True)
+            # PERFORMANCE: st.html (Streamlit >= 1.33) skips the markdown pipeline
+            if hasattr(st, 'html'):
+                st.html(_APP_STYLE)
+            else:
+                st.markdown(_APP_STYLE, unsafe_allow_html=True)
             st.session_state.full_css_loaded = True
     
     def init_session_state(self):
         """Initialize session state variables with cleanup"""
         # PERFORMANCE: Clean up orphaned session state keys periodically
-        from src.web.cache_manager import SessionStateManager
-        
         # Clean orphaned keys on initialization
         if 'last_cleanup' not in st.session_state:
-            removed_count = SessionStateManager.cleanup_orphaned_keys(st.session_state)
-            st.session_state.last_cleanup = lazy_import_time().time()
+            removed_count = _get_session_state_manager().cleanup_orphaned_keys(st.session_state)
+            st.session_state.last_cleanup = time.time()
             if removed_count > 0:
                 print(f"Cleaned up {removed_count} orphaned session state keys")
         else:
             # Clean up every 5 minutes
-            current_time = lazy_import_time().time()
+            current_time = time.time()
             if current_time - st.session_state.last_cleanup > 300:
-                removed_count = SessionStateManager.cleanup_orphaned_keys(st.session_state)
+                removed_count = _get_session_state_manager().cleanup_orphaned_keys(st.session_state)
                 st.session_state.last_cleanup = current_time
                 if removed_count > 0:
                     print(f"Periodic cleanup: removed {removed_count} orphaned keys")
@@ -276,47 +280,55 @@ class BundestagStreamlitApp:
         """Initialize API client only when needed"""
         if self.api_client is None:
             try:
-                BundestagAPIClient = lazy_import_api_client()
-                self.api_client = BundestagAPIClient()
+                self.api_client = _get_api_client()
                 st.session_state.api_connection_status = "connected"
             except Exception as e:
                 st.session_state.api_connection_status = f"error: {str(e)}"
     
+    def _get_openai_key(self) -> Optional[str]:
+        """Resolve the OpenAI API key from the environment or Streamlit secrets
+        (both are cheap in-memory lookups; the secret is never kept in session_state)"""
+        key = os.environ.get('OPENAI_API_KEY')
+        if not key:
+            try:
+                key = st.secrets.get("OPENAI_API_KEY")
+            except Exception:
+                key = None
+        return key
+    
     def ensure_openai_client(self):
         """Initialize OpenAI client only when needed"""
-        current_status = st.session_state.get('openai_status', 'not_initialized')
+        # PERFORMANCE: Readiness is kept per session as openai_status == "connected".
+        # Once a session has passed the is_available() probe, later reruns (which build
+        # a fresh app object) only look up the cache_resource'd handler
+        if st.session_state.get('openai_status') == "connected":
+            if self.openai_handler is None:
+                self.openai_handler = _create_openai_handler(self._get_openai_key())
+            return
         
-        # Only try to initialize if we don't have a working handler or status shows not initialized
-        if (self.openai_handler is None or 
-            not (self.openai_handler and self.openai_handler.is_available()) or
-            current_status == "not_initialized"):
-            
-            # Get OpenAI API key
-            openai_api_key = os.getenv('OPENAI_API_KEY')
-            
-            if not openai_api_key:
-                try:
-                    openai_api_key = st.secrets.get("OPENAI_API_KEY")
-                except:
-                    pass
-            
-            if openai_api_key:
-                try:
-                    self.openai_handler = OpenAIHandler(openai_api_key)
-                    if self.openai_handler.is_available():
-                        st.session_state.openai_status = "connected"
-                    else:
-                        st.session_state.openai_status = "error: Failed to initialize"
-                except Exception as e:
-                    st.session_state.openai_status = f"error: {str(e)}"
-                    self.openai_handler = None
-            else:
-                st.session_state.openai_status = "error: No OpenAI API key found. Set OPENAI_API_KEY environment variable."
+        # Get OpenAI API key
+        openai_api_key = self._get_openai_key()
+        
+        if openai_api_key:
+            try:
+                self.openai_handler = _create_openai_handler(openai_api_key)
+                if self.openai_handler.is_available():
+                    st.session_state.openai_status = "connected"
+                else:
+                    st.session_state.openai_status = "error: Failed to initialize"
+            except Exception as e:
+                st.session_state.openai_status = f"error: {str(e)}"
+                self.openai_handler = None
+        else:
+            st.session_state.openai_status = "error: No OpenAI API key found. Set OPENAI_API_KEY environment variable."
     
     def display_header(self):
         """Display the main header with connection status"""
-        # Load full CSS when displaying UI
-        self.configure_page_full()
+        # Load full CSS when displaying UI - the session guard is checked here so later
+        # renders skip the method call (CSS must reach every session's DOM, so this
+        # cannot be a process-wide st.cache_resource one-shot)
+        if 'full_css_loaded' not in st.session_state:
+            self.configure_page_full()
         # Perform security check when UI is first shown
         self.ensure_security_check()
         
@@ -355,7 +367,12 @@ class BundestagStreamlitApp:
         
         # Perform search if requested
         if search_clicked and self.api_client:
-            results = self.results_manager.perform_search(self.api_client, doc_type, filters, limit)
+            # PERFORMANCE: Identical searches within 10 minutes are served from st.cache_data
+            try:
+                results = _cached_search(self.results_manager, doc_type, tuple(sorted(filters.items())), limit)
+                results["api_client"] = self.api_client
+            except _SearchFailed:
+                results = None
             if results:
 
                 st.session_state.search_results = results
@@ -375,11 +392,12 @@ class BundestagStreamlitApp:
             # Performance optimization: Only update session state if selection actually changed
             if selected_documents:
                 # Check if selection has changed to avoid unnecessary processing
-                current_selection_ids = [doc.get('id', '') for doc in selected_documents]
-                previous_selection_ids = [doc.get('id', '') for doc in st.session_state.get('selected_documents', [])]
+                # PERFORMANCE: Compare one hash of the selected ids instead of two id lists
+                new_key = hash(tuple(doc.get('id', '') for doc in selected_documents))
                 
-                if current_selection_ids != previous_selection_ids:
+                if new_key != st.session_state.get('_sel_key'):
                     st.session_state.selected_documents = selected_documents
+                    st.session_state._sel_key = new_key
                     
                     # Add performance warning for large selections
                     if len(selected_documents) > 20:
@@ -388,6 +406,7 @@ class BundestagStreamlitApp:
                 # Clear selection if no documents selected
                 if st.session_state.get('selected_documents'):
                     st.session_state.selected_documents = []
+                    st.session_state._sel_key = None
                 
             # Always display action buttons and ensure OpenAI client is available
             self.ensure_openai_client()
@@ -396,7 +415,7 @@ class BundestagStreamlitApp:
             button_states = self.results_manager.display_action_buttons(
                 selected_documents, 
                 st.session_state.search_results["doc_type"],
-                openai_available=self.openai_handler is not None and self.openai_handler.is_available()
+                openai_available=st.session_state.openai_status == "connected"
             )
             
             # Handle button clicks
@@ -414,7 +433,6 @@ class BundestagStreamlitApp:
             
             if self.openai_handler:
                 # Run async streaming function
-                asyncio = lazy_import_asyncio()
                 asyncio.run(self.generate_summaries_for_selected_streaming(selected_documents, doc_type))
     
     async def generate_summaries_for_selected_streaming(self, documents: List[Dict[str, Any]], doc_type: str):
@@ -435,94 +453,107 @@ class BundestagStreamlitApp:
         st.session_state.summary_display = self.summary_display
 
         # Create streaming display placeholders
-        placeholders = self.summary_display.create_streaming_display_placeholders(len(documents), doc_type)
+        n_docs = len(documents)
+        placeholders = self.summary_display.create_streaming_display_placeholders(n_docs, doc_type)
 
         summaries = []
         successful_count = 0
+        if 'document_summaries' not in st.session_state:
+            st.session_state.document_summaries = {}
+
+        # PERFORMANCE: Prefetch document i+1's full text while document i's summary is
+        # streaming. A private single-worker pool keeps at most one fetch in flight against
+        # the shared api_client, runs it under this script run's context in case the
+        # fetch touches st.*, and is shut down (queued fetch cancelled) however the loop exits
+        loop = asyncio.get_running_loop()
+        fetcher = ThreadPoolExecutor(
+            max_workers=1, initializer=add_script_run_ctx, initargs=(None, get_script_run_ctx())
+        )
+
+        def fetch_full_text(document: Dict[str, Any]) -> asyncio.Future:
+            return loop.run_in_executor(
+                fetcher, self.openai_handler._fetch_full_text, self.api_client, document.get('id', 'unknown'), doc_type
+            )
 
-        for i, document in enumerate(documents):
-            try:
-                # Update progress
-                current = i + 1
+        next_fetch = fetch_full_text(documents[0]) if documents else None
+        try:
+            for i, document in enumerate(documents):
+                current_fetch = next_fetch
+                next_fetch = fetch_full_text(documents[i + 1]) if i + 1 < n_docs else None
+                # Per-document fields are read once and reused for the whole iteration
+                doc_id = document.get('id', 'unknown')
                 title = document.get('titel', 'No title')
-                self.summary_display.update_streaming_progress(placeholders, current, len(documents), title)
+                try:
+                    # Update progress
+                    self.summary_display.update_streaming_progress(placeholders, i + 1, n_docs, title)
+
+                    # Get document placeholders
+                    doc_placeholder = placeholders['doc_placeholders'][i]
+
+                    # Fetch full text (empty string is returned if no text available)
+                    full_text = await current_fetch
+
+                    # Process document regardless of whether full text is available
+                    # If no full text, the system will generate summary based on metadata
+                    if full_text is not None and not full_text.startswith('Error'):
+                        # Generate streaming summary (works with empty string for metadata-only processing)
+                        summary = await self.openai_handler.generate_summary_streaming(
+                            document, full_text, doc_type, 
+                            doc_placeholder
+                        )
 
-                # Get document placeholders
-                doc_placeholder = placeholders['doc_placeholders'][i]
+                        if summary and not summary.startswith('Error'):
+                            # Show citizen impact processing
+                            self.summary_display.update_citizen_impact_placeholder(doc_placeholder, "", document, False)
+                        
+                            # Generate streaming citizen impact analysis
+                            citizen_impact = await self.openai_handler.generate_citizen_impact_summary_streaming(
+                                document, summary, doc_type,
+                                doc_placeholder['citizen_impact']
+                            )
 
-                # Log document processing start
-                doc_id = document.get('id', 'unknown')
+                            # Update citizen impact display with final result
+                            if citizen_impact and not citizen_impact.startswith('Error'):
+                                self.summary_display.update_citizen_impact_placeholder(doc_placeholder, citizen_impact, document, True)
+                                # Store in session state for later access
+                                self.summary_display.store_citizen_impact_analysis(doc_id, citizen_impact)
 
-                # Fetch full text (empty string is returned if no text available)
-                full_text = self.openai_handler._fetch_full_text(self.api_client, doc_id, doc_type)
-
-                # Process document regardless of whether full text is available
-                # If no full text, the system will generate summary based on metadata
-                if full_text is not None and not full_text.startswith('Error'):
-                    # Generate streaming summary (works with empty string for metadata-only processing)
-                    summary = await self.openai_handler.generate_summary_streaming(
-                        document, full_text, doc_type, 
-                        doc_placeholder
-                    )
-
-                    if summary and not summary.startswith('Error'):
-                        # Show citizen impact processing
-                        self.summary_display.update_citizen_impact_placeholder(doc_placeholder, "", document, False)
-                        
-                        # Generate streaming citizen impact analysis
-                        citizen_impact = await self.openai_handler.generate_citizen_impact_summary_streaming(
-                            document, summary, doc_type,
-                            doc_placeholder['citizen_impact']
-                        )
+                            # Store results - one record per document, shared by the returned
+                            # list and session state (no second dict, no second timestamp)
+                            record = {
+                                'doc_id': doc_id,
+                                'summary': summary,
+                                'citizen_impact': citizen_impact if not citizen_impact.startswith('Error') else '',
+                                'full_text': full_text,
+                                'document': document,
+                                'timestamp': datetime.now().isoformat()
+                            }
 
-                        # Update citizen impact display with final result
-                        if citizen_impact and not citizen_impact.startswith('Error'):
-                            self.summary_display.update_citizen_impact_placeholder(doc_placeholder, citizen_impact, document, True)
-                            # Store in session state for later access
-                            self.summary_display.store_citizen_impact_analysis(doc_id, citizen_impact)
+                            summaries.append(record)
+                            successful_count += 1
 
-                        # Store results
-                        datetime = lazy_import_datetime()
-                        summary_data = {
-                            'doc_id': doc_id,
-                            'document': document,
-                            'summary': summary,
-                            'citizen_impact': citizen_impact if not citizen_impact.startswith('Error') else '',
-                            'full_text': full_text,
-                            'timestamp': datetime.now().isoformat()
-                        }
-
-                        summaries.append(summary_data)
-                        successful_count += 1
-
-                        # Store in session state
-                        if 'document_summaries' not in st.session_state:
-                            st.session_state.document_summaries = {}
-                        
-                        datetime = lazy_import_datetime()
-                        st.session_state.document_summaries[doc_id] = {
-                            'summary': summary,
-                            'citizen_impact': citizen_impact if not citizen_impact.startswith('Error') else '',
-                            'full_text': full_text,
-                            'document': document,
-                            'timestamp': datetime.now().isoformat()
-                        }
+                            # Store in session state
+                            st.session_state.document_summaries[doc_id] = record
 
-                    else:
-                        doc_placeholder['summary'].error(f"Failed to generate summary: {summary}")
+                        else:
+                            doc_placeholder['summary'].error(f"Failed to generate summary: {summary}")
 
-                else:
-                    doc_placeholder['summary'].error(f"Failed to fetch document text: {full_text}")
+                    else:
+                        doc_placeholder['summary'].error(f"Failed to fetch document text: {full_text}")
 
-            except Exception as e:
-                error_msg = f"Error processing document {i+1}: {str(e)}"
-                st.error(error_msg)
-                doc_placeholder['summary'].error(error_msg)
+                except Exception as e:
+                    error_msg = f"Error processing document {i+1}: {str(e)}"
+                    st.error(error_msg)
+                    doc_placeholder['summary'].error(error_msg)
+        finally:
+            if next_fetch is not None:
+                next_fetch.cancel()
+            fetcher.shutdown(wait=False, cancel_futures=True)
 
         # Complete processing
-        self.summary_display.complete_streaming_display(placeholders, successful_count, len(documents))
+        self.summary_display.complete_streaming_display(placeholders, successful_count, n_docs)
 
-        st.success(f"✅ Streaming processing completed! {successful_count}/{len(documents)} summaries generated successfully")
+        st.success(f"✅ Streaming processing completed! {successful_count}/{n_docs} summaries generated successfully")
 
         return summaries
     
@@ -531,25 +562,28 @@ class BundestagStreamlitApp:
         requests = self.summary_display.check_citizen_impact_requests()
         
         if requests and self.openai_handler:
+            # PERFORMANCE: Index the current results by id once per result set instead of
+            # scanning them for every request (identity check keeps the index in sync)
+            search_results = st.session_state.search_results
+            docs_by_id = {}
+            if search_results:
+                if st.session_state.get('_docs_by_id_src') is not search_results:
+                    st.session_state._docs_by_id = {str(d.get('id')): d for d in search_results["documents"]}
+                    st.session_state._docs_by_id_src = search_results
+                docs_by_id = st.session_state._docs_by_id
+            
             for doc_id in requests:
                 # Find the document and its data
                 document_data = None
-                ai_summary = ""
                 doc_type = ""
                 
                 # Look for the document in session state
-                for stored_doc_id, summary_data in st.session_state.document_summaries.items():
-                    if stored_doc_id == doc_id:
-                        ai_summary = summary_data.get('summary', '')
-                        break
+                ai_summary = st.session_state.document_summaries.get(doc_id, {}).get('summary', '')
                 
                 # Find the document from current search results
-                if st.session_state.search_results:
-                    doc_type = st.session_state.search_results["doc_type"]
-                    for doc in st.session_state.search_results["documents"]:
-                        if str(doc.get('id')) == str(doc_id):
-                            document_data = doc
-                            break
+                if search_results:
+                    doc_type = search_results["doc_type"]
+                    document_data = docs_by_id.get(str(doc_id))
                 
                 if document_data and ai_summary:
                     # Preserve current modal state before generation
@@ -570,30 +604,21 @@ class BundestagStreamlitApp:
                             
                             st.success(f"✅ Citizen impact analysis generated for document {doc_id}")
                             
-                            # Explicitly restore modal state after generation
-                            if modal_was_open and modal_data:
-                                st.session_state.show_summary_modal = True
-                                st.session_state.modal_summary_data = modal_data
-                            
-                            # Clear the preserve state flag 
-                            if 'modal_preserve_state' in st.session_state:
-                                del st.session_state.modal_preserve_state
-                            
-                            # Rerun to update the modal content
+                            # Rerun to update the modal content (the finally block runs first)
                             st.rerun()
                             
                         except Exception as e:
                             st.error(f"Failed to generate citizen impact analysis: {str(e)}")
                             st.session_state.generating_citizen_impact = False
-                            
-                            # Restore modal state on error too
+                        
+                        finally:
+                            # Explicitly restore modal state after generation (success or error)
                             if modal_was_open and modal_data:
                                 st.session_state.show_summary_modal = True
                                 st.session_state.modal_summary_data = modal_data
-                                
-                            # Clear the preserve state flag on error
-                            if 'modal_preserve_state' in st.session_state:
-                                del st.session_state.modal_preserve_state
+                            
+                            # Clear the preserve state flag
+                            st.session_state.pop('modal_preserve_state', None)
                 else:
                     # No document data or AI summary available
                     if not document_data:
@@ -602,8 +627,7 @@ class BundestagStreamlitApp:
                         st.error(f"AI summary not available for document {doc_id}. Please generate a summary first.")
                     st.session_state.generating_citizen_impact = False
                     # Clear the preserve state flag
-                    if 'modal_preserve_state' in st.session_state:
-                        del st.session_state.modal_preserve_state
+                    st.session_state.pop('modal_preserve_state', None)
     
     def display_analytics_tab(self):
         """Analytics functionality has been removed to improve performance"""
@@ -616,412 +640,6 @@ class BundestagStreamlitApp:
     def plot_urheber_analytics(self, documents: List[Dict[str, Any]]):
         """Analytics functionality has been removed to improve performance"""
         st.info("📊 Urheber analytics have been temporarily disabled to improve performance with large datasets.")
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            with st.spinner("Analyzing Urheber distribution..."):
-                # Performance: Use list comprehension with flattening for better efficiency
-                urheber_list = []
-                
-                # Batch processing for better performance
-                batch_size = 500
-                total_batches = (len(documents) - 1) // batch_size + 1
-                
-                if total_batches > 1:
-                    progress_bar = st.progress(0)
-                    status_text = st.empty()
-                
-                for batch_idx in range(total_batches):
-                    start_idx = batch_idx * batch_size
-                    end_idx = min(start_idx + batch_size, len(documents))
-                    batch = documents[start_idx:end_idx]
-                    
-                    if total_batches > 1:
-                        progress = (batch_idx + 1) / total_batches
-                        progress_bar.progress(progress)
-                        status_text.text(f"Processing batch {batch_idx + 1}/{total_batches}...")
-                    
-                    # Process batch
-                    for doc in batch:
-                        urheber = doc.get('urheber', [])
-                        if urheber:
-                            for urh in urheber:
-                                if isinstance(urh, dict) and urh.get('bezeichnung'):
-                                    urheber_list.append(urh['bezeichnung'])
-                                elif isinstance(urh, str):
-                                    urheber_list.append(urh)
-                
-                if total_batches > 1:
-                    progress_bar.progress(1.0)
-                    status_text.text("Processing complete!")
-                
-                if urheber_list:
-                    # Performance: Use Counter for faster counting
-                    from collections import Counter
-                    urheber_counts = Counter(urheber_list)
-                    pd = lazy_import_pandas()
-                    urheber_counts = pd.Series(urheber_counts).sort_values(ascending=False)
-                    
-                    # Limit categories for performance - reduced thresholds
-                    if len(urheber_counts) > 10:
-                        top_urheber = urheber_counts.head(8)
-                        others_count = urheber_counts.tail(len(urheber_counts) - 8).sum()
-                        if others_count > 0:
-                            top_urheber['Others'] = others_count
-                        urheber_counts = top_urheber
-                    
-                    # Optimized Plotly config
-                    config = BrowserOptimizations.optimize_plotly_config()
-                    config.update({
-                        'displayModeBar': False,
-                        'staticPlot': False,
-                        'doubleClick': False
-                    })
-                    
-                    px = lazy_import_plotly()
-                    fig = px.pie(
-                        values=urheber_counts.values,
-                        names=urheber_counts.index,
-                        title=f"Urheber Distribution ({len(documents):,} documents)" + 
-                              (f" from {original_count:,} total" if original_count != len(documents) else ""),
-                        hole=0.3  # Make it a donut chart for better readability
-                    )
-                    
-                    # Performance optimizations
-                    fig.update_traces(
-                        textposition='inside', 
-                        textinfo='percent+label',
-                        hovertemplate='%{label}<br>Count: %{value}<br>Percentage: %{percent}<extra></extra>',
-                        marker_line_width=0
-                    )
-                    
-                    fig.update_layout(
-                        showlegend=True,
-                        legend=dict(orientation="h", yanchor="bottom", y=-0.2),
-                        margin=dict(t=50, b=50, l=50, r=50),
-                        height=400
-                    )
-                    
-                    st.plotly_chart(fig, use_container_width=True, config=config)
-                else:
-                    st.info("No urheber data available for visualization")
-        
-        with col2:
-            # Show urheber statistics with bar chart
-            if urheber_list:
-                st.metric("Total Urheber Entries", f"{len(urheber_list):,}")
-                st.metric("Unique Urheber", len(set(urheber_list)))
-                
-                # Create bar chart for top urheber
-                pd = lazy_import_pandas()
-                top_urheber = pd.Series(urheber_list).value_counts()
-                
-                # Limit to top 10 for the bar chart
-                top_10_urheber = top_urheber.head(10)
-                
-                # Optimized Plotly config for bar chart
-                config = BrowserOptimizations.optimize_plotly_config()
-                config.update({
-                    'displayModeBar': False,
-                    'staticPlot': False,
-                    'doubleClick': False
-                })
-                
-                px = lazy_import_plotly()
-                fig_bar = px.bar(
-                    x=top_10_urheber.values,
-                    y=top_10_urheber.index,
-                    orientation='h',
-                    title="Top 10 Urheber by Document Count",
-                    labels={'x': 'Number of Documents', 'y': 'Urheber'},
-                    color=top_10_urheber.values,
-                    color_continuous_scale='Blues'
-                )
-                
-                # Update layout for better readability
-                fig_bar.update_layout(
-                    showlegend=False,
-                    margin=dict(t=50, b=30, l=150, r=30),
-                    height=400,
-                    xaxis_title="Document Count",
-                    yaxis_title="",
-                    coloraxis_showscale=False
-                )
-                
-                # Add value labels on bars
-                fig_bar.update_traces(
-                    texttemplate='%{x:,.0f}',
-                    textposition='outside',
-                    hovertemplate='%{y}<br>Documents: %{x:,.0f}<extra></extra>'
-                )
-                
-                st.plotly_chart(fig_bar, use_container_width=True, config=config)
-            else:
-                st.info("No urheber statistics available")
-        
-        # Add Urheber timeseries chart below
-        st.markdown("#### 📊 Urheber Distribution Over Time")
-        self._plot_urheber_timeseries(documents)
-    
-    def _plot_urheber_timeseries(self, documents: List[Dict[str, Any]]):
-        """Create a stacked bar chart showing Urheber distribution over time"""
-        
-        # Performance optimization: Handle large datasets - reduced thresholds
-        original_count = len(documents)
-        if original_count > 1000:  # Reduced threshold
-            st.warning(f"⚠️ Large dataset detected ({original_count:,} documents). Using optimized sampling for better performance.")
-            documents = self._sample_documents_for_visualization(documents, max_size=800)  # Reduced sample size
-            st.info(f"📊 Using representative sample of {len(documents):,} documents for visualization")
-        
-        # Performance: Batch processing for better efficiency
-        data_rows = []
-        batch_size = 200  # Process in smaller batches
-        total_batches = (len(documents) - 1) // batch_size + 1
-        
-        if total_batches > 1:
-            progress_bar = st.progress(0)
-            status_text = st.empty()
-        
-        for batch_idx in range(total_batches):
-            start_idx = batch_idx * batch_size
-            end_idx = min(start_idx + batch_size, len(documents))
-            batch = documents[start_idx:end_idx]
-            
-            if total_batches > 1:
-                progress = (batch_idx + 1) / total_batches
-                progress_bar.progress(progress)
-                status_text.text(f"Processing batch {batch_idx + 1}/{total_batches}...")
-            
-            # Process batch efficiently
-            for doc in batch:
-                # Get date
-                date_str = doc.get('datum')
-                if not date_str:
-                    continue
-                    
-                try:
-                    pd = lazy_import_pandas()
-                    date = pd.to_datetime(date_str)
-                except:
-                    continue
-                
-                # Get urheber
-                urheber_list = doc.get('urheber', [])
-                if not urheber_list:
-                    continue
-                
-                # Extract urheber names
-                for urh in urheber_list:
-                    if isinstance(urh, dict) and urh.get('bezeichnung'):
-                        urheber_name = urh['bezeichnung']
-                    elif isinstance(urh, str):
-                        urheber_name = urh
-                    else:
-                        continue
-                    
-                    data_rows.append({
-                        'date': date,
-                        'urheber': urheber_name
-                    })
-        
-        # Clear progress indicators
-        if total_batches > 1:
-            progress_bar.progress(1.0)
-            status_text.text("Processing complete!")
-            
-        if not data_rows:
-            st.info("No date and urheber information available for timeseries chart")
-            return
-        
-        # Performance check: Limit data complexity - reduced thresholds
-        if len(data_rows) > 5000:  # Reduced from 10000
-            st.warning(f"⚠️ Very large dataset ({len(data_rows):,} data points). Further sampling applied.")
-            # Sample data points while maintaining temporal distribution
-            data_rows = self._sample_data_points(data_rows, max_points=4000)  # Reduced from 8000
-        
-        with st.spinner("Creating visualization..."):
-            # Performance: Create DataFrame more efficiently
-            pd = lazy_import_pandas()
-            df = pd.DataFrame(data_rows)
-            df['year_month'] = df['date'].dt.to_period('M')
-            
-            # Performance: Use more efficient aggregation
-            grouped = df.groupby(['year_month', 'urheber']).size().reset_index(name='count')
-            
-            # Get top urheber to avoid too many categories - reduced further
-            top_urheber = df['urheber'].value_counts().head(6).index.tolist()  # Reduced from 8 to 6
-            
-            # Filter to top urheber and group others
-            grouped['urheber_display'] = grouped['urheber'].apply(
-                lambda x: x if x in top_urheber else 'Others'
-            )
-            
-            # Reaggregate after grouping others
-            final_grouped = grouped.groupby(['year_month', 'urheber_display'])['count'].sum().reset_index()
-            
-            # Convert period to string for plotting
-            final_grouped['month_str'] = final_grouped['year_month'].astype(str)
-            
-            # Performance: Create pivot table more efficiently
-            pivot_df = final_grouped.pivot(index='month_str', columns='urheber_display', values='count').fillna(0)
-            
-            if pivot_df.empty:
-                st.info("Insufficient data for timeseries visualization")
-                return
-            
-            # Performance optimization: Limit time series complexity - reduced further
-            if len(pivot_df) > 48:  # More than 4 years of monthly data
-                st.info(f"📊 Large time range detected ({len(pivot_df)} months). Showing recent data for optimal performance.")
-                pivot_df = pivot_df.tail(48)  # Show last 4 years
-            
-            # Optimized Plotly config
-            config = BrowserOptimizations.optimize_plotly_config()
-            config.update({
-                'displayModeBar': False,
-                'staticPlot': False,
-                'scrollZoom': False,
-                'doubleClick': False
-            })
-            
-            # Create stacked bar chart with performance optimizations
-            px = lazy_import_plotly()
-            fig = px.bar(
-                pivot_df.reset_index(),
-                x='month_str',
-                y=pivot_df.columns.tolist(),
-                title=f"Urheber Distribution Over Time ({len(data_rows):,} document entries" + 
-                      (f" from {original_count:,} total" if original_count != len(documents) else "") + ")",
-                labels={'month_str': 'Month', 'value': 'Number of Documents', 'variable': 'Urheber'},
-                height=450  # Reduced height for better performance
-            )
-            
-            # Update layout for better readability and performance
-            fig.update_layout(
-                xaxis_title="Month",
-                yaxis_title="Number of Documents",
-                legend_title="Urheber",
-                barmode='stack',
-                xaxis={'tickangle': 45},
-                margin=dict(t=50, b=100, l=50, r=50),
-                # Performance optimizations
-                showlegend=True,
-                legend=dict(
-                    orientation="h",
-                    yanchor="bottom",
-                    y=-0.2,  # Move legend below chart
-                    xanchor="center",
-                    x=0.5
-                )
-            )
-            
-            # Performance: Optimize trace rendering
-            fig.update_traces(
-                hovertemplate='%{x}<br>%{fullData.name}: %{y}<br>Total: %{y}<extra></extra>',
-                marker_line_width=0.5
-            )
-            
-            # Show only every nth x-axis label to avoid clutter and improve performance
-            if len(pivot_df) > 15:  # Reduced threshold
-                fig.update_layout(
-                    xaxis={'tickmode': 'linear', 'dtick': max(1, len(pivot_df) // 8)}  # Reduced to ~8 labels max
-                )
-            
-            st.plotly_chart(fig, use_container_width=True, config=config)
-        
-        # Show summary statistics
-        col1, col2, col3 = st.columns(3)
-        
-        with col1:
-            st.metric("Documents with Date & Urheber", f"{len(data_rows):,}")
-        
-        with col2:
-            months_span = pivot_df.index.nunique()
-            st.metric("Months Covered", months_span)
-        
-        with col3:
-            urheber_count = final_grouped['urheber_display'].nunique()
-            st.metric("Urheber Categories", urheber_count)
-    
-    def _sample_documents_for_visualization(self, documents: List[Dict[str, Any]], max_size: int) -> List[Dict[str, Any]]:
-        """Intelligently sample documents for visualization while maintaining distribution"""
-        if len(documents) <= max_size:
-            return documents
-        
-        # Use stratified sampling based on date to maintain temporal distribution
-        try:
-            # Create DataFrame for sampling
-            pd = lazy_import_pandas()
-            df = pd.DataFrame(documents)
-            
-            # Convert dates and extract year-month for stratification
-            df['datum_parsed'] = pd.to_datetime(df['datum'], errors='coerce')
-            df = df.dropna(subset=['datum_parsed'])
-            
-            if df.empty:
-                # Fallback to random sampling if no valid dates
-                random = lazy_import_random()
-                return random.sample(documents, max_size)
-            
-            # Group by year-month for stratified sampling
-            df['year_month'] = df['datum_parsed'].dt.to_period('M')
-            
-            # Calculate sample size per stratum
-            strata_counts = df['year_month'].value_counts()
-            total_ratio = max_size / len(df)
-            
-            sampled_indices = []
-            for stratum, count in strata_counts.items():
-                stratum_df = df[df['year_month'] == stratum]
-                sample_size = max(1, int(count * total_ratio))
-                sample_size = min(sample_size, len(stratum_df))
-                
-                if sample_size > 0:
-                    sampled_indices.extend(
-                        stratum_df.sample(n=sample_size, random_state=42).index.tolist()
-                    )
-            
-            # Return sampled documents
-            return [documents[i] for i in sampled_indices[:max_size]]
-            
-        except Exception as e:
-            # Fallback to random sampling if stratified sampling fails
-            st.warning(f"Stratified sampling failed, using random sampling: {str(e)}")
-            random = lazy_import_random()
-            return random.sample(documents, max_size)
-    
-    def _sample_data_points(self, data_rows: List[Dict], max_points: int) -> List[Dict]:
-        """Sample data points while maintaining temporal distribution"""
-        if len(data_rows) <= max_points:
-            return data_rows
-        
-        try:
-            # Convert to DataFrame for easier sampling
-            pd = lazy_import_pandas()
-            df = pd.DataFrame(data_rows)
-            df['year_month'] = df['date'].dt.to_period('M')
-            
-            # Stratified sampling by month
-            strata_counts = df['year_month'].value_counts()
-            total_ratio = max_points / len(df)
-            
-            sampled_data = []
-            for stratum, count in strata_counts.items():
-                stratum_df = df[df['year_month'] == stratum]
-                sample_size = max(1, int(count * total_ratio))
-                sample_size = min(sample_size, len(stratum_df))
-                
-                if sample_size > 0:
-                    sampled_data.extend(
-                        stratum_df.sample(n=sample_size, random_state=42).to_dict('records')
-                    )
-            
-            return sampled_data[:max_points]
-            
-        except Exception:
-            # Fallback to simple random sampling
-            random = lazy_import_random()
-            return random.sample(data_rows, max_points)
     
     def plot_vorgang_analytics(self, documents: List[Dict[str, Any]]):
         """Create analytics plots for Vorgänge"""
@@ -1031,10 +649,10 @@ class BundestagStreamlitApp:
         
         with col1:
             types = [doc.get('vorgangstyp', 'Unknown') for doc in documents]
-            pd = lazy_import_pandas()
+            pd = _lazy('pd')
             type_counts = pd.Series(types).value_counts()
             
-            px = lazy_import_plotly()
+            px = _lazy('px')
             fig = px.bar(
                 x=type_counts.values,
                 y=type_counts.index,
@@ -1047,10 +665,10 @@ class BundestagStreamlitApp:
         
         with col2:
             statuses = [doc.get('beratungsstand', 'Unknown') for doc in documents]
-            pd = lazy_import_pandas()
+            pd = _lazy('pd')
             status_counts = pd.Series(statuses).value_counts()
             
-            px = lazy_import_plotly()
+            px = _lazy('px')
             fig = px.pie(
                 values=status_counts.values,
                 names=status_counts.index,
@@ -1064,7 +682,7 @@ class BundestagStreamlitApp:
         # Fast startup indicator
         if 'app_fully_loaded' not in st.session_state:
             with st.spinner("⚡ Starting application (optimized for speed)..."):
-                lazy_import_time().sleep(0.1)  # Minimal delay to show message
+                time.sleep(0.1)  # Minimal delay to show message
             st.session_state.app_fully_loaded = True
         
         # Check if we should display documentation pages
@@ -1105,89 +723,7 @@ class BundestagStreamlitApp:
     def display_architecture_page(self):
         """Display the architecture documentation page"""
         # Add CSS to fix header and scroll bar issues
-        st.markdown("""
-        <style>
-            /* Fix scroll bar and header issues for documentation pages */
-            .main .block-container {
-                padding-top: 1rem !important;
-                max-height: none !important;
-                overflow: visible !important;
-            }
-            
-            /* Ensure proper scrolling for content */
-            .stApp {
-                overflow-y: scroll !important;
-                height: 100vh !important;
-                overflow-x: hidden !important;
-            }
-            
-            /* Fix header positioning and prevent it from interfering */
-            .main-header {
-                position: relative !important;
-                z-index: 1 !important;
-                margin-bottom: 1rem !important;
-            }
-            
-            /* Ensure content area is properly scrollable */
-            .element-container {
-                overflow: visible !important;
-                position: relative !important;
-            }
-            
-            /* CRITICAL: Fix Streamlit header interference */
-            div[data-testid="stHeader"] {
-                position: relative !important;
-                height: auto !important;
-                z-index: 0 !important;
-                overflow: visible !important;
-            }
-            
-            /* Prevent header hover effects from affecting scroll */
-            header[data-testid="stHeader"] {
-                position: relative !important;
-                height: auto !important;
-                overflow: visible !important;
-                z-index: 0 !important;
-            }
-            
-            /* Force scroll bar to always be visible */
-            html, body {
-                overflow-y: scroll !important;
-                height: 100% !important;
-            }
-            
-            /* Prevent any elements from hiding scroll bar */
-            * {
-                scrollbar-width: auto !important;
-            }
-            
-            /* Fix for webkit browsers */
-            ::-webkit-scrollbar {
-                width: 16px !important;
-                background: #f1f1f1 !important;
-            }
-            
-            ::-webkit-scrollbar-thumb {
-                background: #c1c1c1 !important;
-                border-radius: 10px !important;
-            }
-            
-            ::-webkit-scrollbar-thumb:hover {
-                background: #a8a8a8 !important;
-            }
-            
-            /* Ensure main content doesn't interfere with scroll */
-            .main {
-                overflow: visible !important;
-                height: auto !important;
-            }
-            
-            /* Fix any iframe or embedded content */
-            iframe {
-                overflow: visible !important;
-            }
-        </style>
-        """, unsafe_allow_html=True)
+        _inject_doc_page_css()
         
         st.markdown('<h1 class="main-header">🏗️ Architecture & Data Flow Documentation</h1>', unsafe_allow_html=True)
         
@@ -1199,12 +735,10 @@ class BundestagStreamlitApp:
         st.markdown("---")
         
         try:
-            from pathlib import Path
-            docs_path = Path(__file__).parent.parent.parent / "docs" / "ARCHITECTURE_AND_DATAFLOW.md"
+            docs_path = project_root / "docs" / "ARCHITECTURE_AND_DATAFLOW.md"
             
             if docs_path.exists():
-                with open(docs_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
+                content = _load_docs(str(docs_path), docs_path.stat().st_mtime)
                 st.markdown(content)
             else:
                 st.error("Architecture documentation file not found")
@@ -1216,89 +750,7 @@ class BundestagStreamlitApp:
     def display_api_docs_page(self):
         """Display the API documentation page"""
         # Add CSS to fix header and scroll bar issues
-        st.markdown("""
-        <style>
-            /* Fix scroll bar and header issues for documentation pages */
-            .main .block-container {
-                padding-top: 1rem !important;
-                max-height: none !important;
-                overflow: visible !important;
-            }
-            
-            /* Ensure proper scrolling for content */
-            .stApp {
-                overflow-y: scroll !important;
-                height: 100vh !important;
-                overflow-x: hidden !important;
-            }
-            
-            /* Fix header positioning and prevent it from interfering */
-            .main-header {
-                position: relative !important;
-                z-index: 1 !important;
-                margin-bottom: 1rem !important;
-            }
-            
-            /* Ensure content area is properly scrollable */
-            .element-container {
-                overflow: visible !important;
-                position: relative !important;
-            }
-            
-            /* CRITICAL: Fix Streamlit header interference */
-            div[data-testid="stHeader"] {
-                position: relative !important;
-                height: auto !important;
-                z-index: 0 !important;
-                overflow: visible !important;
-            }
-            
-            /* Prevent header hover effects from affecting scroll */
-            header[data-testid="stHeader"] {
-                position: relative !important;
-                height: auto !important;
-                overflow: visible !important;
-                z-index: 0 !important;
-            }
-            
-            /* Force scroll bar to always be visible */
-            html, body {
-                overflow-y: scroll !important;
-                height: 100% !important;
-            }
-            
-            /* Prevent any elements from hiding scroll bar */
-            * {
-                scrollbar-width: auto !important;
-            }
-            
-            /* Fix for webkit browsers */
-            ::-webkit-scrollbar {
-                width: 16px !important;
-                background: #f1f1f1 !important;
-            }
-            
-            ::-webkit-scrollbar-thumb {
-                background: #c1c1c1 !important;
-                border-radius: 10px !important;
-            }
-            
-            ::-webkit-scrollbar-thumb:hover {
-                background: #a8a8a8 !important;
-            }
-            
-            /* Ensure main content doesn't interfere with scroll */
-            .main {
-                overflow: visible !important;
-                height: auto !important;
-            }
-            
-            /* Fix any iframe or embedded content */
-            iframe {
-                overflow: visible !important;
-            }
-        </style>
-        """, unsafe_allow_html=True)
+        _inject_doc_page_css()
         
         st.markdown('<h1 class="main-header">📖 API Documentation</h1>', unsafe_allow_html=True)
         
@@ -1310,8 +762,7 @@ class BundestagStreamlitApp:
         st.markdown("---")
         
         try:
-            from pathlib import Path
-            docs_path = Path(__file__).parent.parent.parent / "docs" / "README.md"
+            docs_path = project_root / "docs" / "README.md"
             
             # Default API documentation content
             content = """
@@ -1408,10 +859,8 @@ Use the web interface to:
             # Try to read from file if it exists
             if docs_path.exists():
                 try:
-                    with open(docs_path, 'r', encoding='utf-8') as f:
-                        file_content = f.read()
-                    content = file_content
-                except:
+                    content = _load_docs(str(docs_path), docs_path.stat().st_mtime)
+                except Exception:
                     pass  # Use default content if file reading fails
             
             st.markdown(content)
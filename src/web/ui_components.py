@@ -7,35 +7,202 @@ Refactored to focus only on streaming summaries and citizen impact analysis.
 import streamlit as st
 import pandas as pd
 import json
+import hashlib
 import html
+import re
 from datetime import datetime
+from functools import lru_cache
+from itertools import islice
 from typing import Dict, List, Any, Optional
-import plotly.express as px
 
 from src.utils.helpers import format_date
 
+try:
+    import orjson  # Optional: ~3-10x faster JSON serialization, returns bytes directly
+except ImportError:
+    orjson = None
+
+# PERFORMANCE: Characters html.escape would replace; a C-level regex scan lets
+# content without any of them (typical AI summaries) skip escaping entirely
+_ESCAPE_NEEDED = re.compile(r'[&<>"\']')
+# Same mapping as html.escape(quote=True), applied in one str.translate pass
+_HTML_TRANS = str.maketrans({'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#x27;'})
+
+# Markdown indicators; content counts as markdown when at least two distinct ones occur
+_MD_INDICATORS = (
+    '# ',       # Headers
+    '## ',      # Subheaders
+    '### ',     # Sub-subheaders
+    '**',       # Bold
+    '*',        # Italic (but not too common to avoid false positives)
+    '- ',       # Lists
+    '1. ',      # Numbered lists
+    '`',        # Code
+    '```',      # Code blocks
+    '[',        # Links
+    '|',        # Tables
+)
+# PERFORMANCE: One regex pass instead of one substring scan per indicator. A match
+# implies every indicator it contains (e.g. '**' also means '*' is present).
+# Scanning the str directly beats encoding to UTF-8 and matching bytes, even for
+# emoji-widened (UCS-4) strings: the encode is a full extra pass plus a copy.
+_MD_HINTS = re.compile(r'#{1,3} |\*\*?|- |1\. |`(?:``)?|\[|\|')
+_MD_HINT_IMPLIES = {
+    token: frozenset(ind for ind in _MD_INDICATORS if ind in token)
+    for token in ('# ', '## ', '### ', '*', '**', '- ', '1. ', '`', '```', '[', '|')
+}
+
+
+# PERFORMANCE: Static HTML wrappers of the streaming/author banners, built once;
+# only the dynamic text is formatted per call and joined in between
+_PROGRESS_PREFIX = """
+        <div style="
+            background: linear-gradient(135deg, #f0f4f8 0%, #e2e8f0 100%);
+            padding: 12px;
+            border-radius: 6px;
+            border-left: 3px solid #667eea;
+            margin: 5px 0;
+            box-shadow: 0 1px 3px rgba(0,0,0,0.1);
+        ">
+            <div style="
+                color: #2d3748;
+                font-weight: 500;
+                font-size: 14px;
+            ">
+                🔄 Processing """
+_PROGRESS_SUFFIX = """
+            </div>
+        </div>
+        """
+_COMPLETE_PREFIX = """
+        <div style="
+            background: linear-gradient(135deg, #f8f9fa 0%, #e9ecef 100%);
+            padding: 15px;
+            border-radius: 8px;
+            border-left: 4px solid #6c757d;
+            margin: 10px 0;
+            text-align: center;
+            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+        ">
+            <div style="
+                color: #495057;
+                font-weight: bold;
+                font-size: 16px;
+            ">
+                ✅ Completed """
+_COMPLETE_SUFFIX = """ summaries successfully
+            </div>
+        </div>
+        """
+_STREAM_HEADER_PREFIX = """
+        <div style="
+            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+            padding: 20px;
+            border-radius: 12px;
+            margin: 20px 0;
+            text-align: center;
+            box-shadow: 0 4px 6px rgba(0,0,0,0.1);
+        ">
+            <div style="
+                color: white;
+                font-size: 24px;
+                font-weight: bold;
+                margin-bottom: 8px;
+            ">
+                🤖 Processing Documents
+            </div>
+            <div style="
+                color: rgba(255,255,255,0.9);
+                font-size: 16px;
+            ">
+                Analyzing """
+_STREAM_HEADER_SUFFIX = """ documents
+            </div>
+        </div>
+        """
+_AUTHOR_PREFIX = """
+            <div style="
+                background: #e3f2fd;
+                border-left: 3px solid #1976d2;
+                padding: 8px 12px;
+                border-radius: 3px;
+                margin: 8px 0;
+                font-size: 13px;
+                color: #1565c0;
+            ">
+                📝 <strong>Author(s):</strong> """
+_AUTHOR_SUFFIX = """
+            </div>
+            """
+
+
+@lru_cache(maxsize=None)
+def _get_px():
+    """Import plotly.express on first use - only the analytics views need it"""
+    import plotly.express as px
+    return px
+
+
+def _dumps_download(data: Dict[str, Any]) -> bytes:
+    """Serialize a download payload as indented UTF-8 JSON (orjson when available)"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+@st.cache_data(max_entries=16, ttl=600, show_spinner=False)
+def _download_payload(doc_id: str, summary_key: str, impact_key: str, generated_at: str,
+                      _combined_data: Dict[str, Any]) -> bytes:
+    """Serialized "Download All" payload for one summary/analysis version.
+
+    Only (doc_id, summary_key, impact_key, generated_at) are hashed - the underscore-prefixed
+    combined data (document plus possibly megabytes of full text) is derived from them.
+    """
+    return _dumps_download(_combined_data)
+
+
+@lru_cache(maxsize=64)
+def _stream_header_html(num_documents: int, doc_type: str) -> str:
+    """Streaming-mode banner HTML, built once per (num_documents, doc_type)"""
+    return "".join((_STREAM_HEADER_PREFIX, f"{num_documents} {doc_type}", _STREAM_HEADER_SUFFIX))
+
+
+def _iter_author_names(entries: Any, field: str):
+    """Lazily yield the non-empty ``field`` values of a urheber/autoren_anzeige list"""
+    if not isinstance(entries, list):
+        return iter(())
+    return (name for entry in entries if isinstance(entry, dict) and (name := entry.get(field)))
+
+
+@lru_cache(maxsize=512)
+def _content_key(content: str) -> str:
+    """Stable, collision-resistant widget-key suffix for a content string
+    (replaces hash(content) % 10000, which collides after ~100 items)"""
+    return hashlib.blake2b(content.encode('utf-8'), digest_size=6).hexdigest()
+
 
 class SummaryDisplayManager:
     """Manages the display of AI summaries and related UI components"""
     
     def __init__(self):
+        ss = st.session_state  # PERFORMANCE: resolve the proxy once per method, not per access
         # Initialize modal state
-        if 'show_summary_modal' not in st.session_state:
-            st.session_state.show_summary_modal = False
-        if 'modal_summary_data' not in st.session_state:
-            st.session_state.modal_summary_data = None
+        if 'show_summary_modal' not in ss:
+            ss.show_summary_modal = False
+        if 'modal_summary_data' not in ss:
+            ss.modal_summary_data = None
         # Initialize citizen impact analysis state
-        if 'citizen_impact_analysis' not in st.session_state:
-            st.session_state.citizen_impact_analysis = {}
-        if 'generating_citizen_impact' not in st.session_state:
-            st.session_state.generating_citizen_impact = False
+        if 'citizen_impact_analysis' not in ss:
+            ss.citizen_impact_analysis = {}
+        if 'generating_citizen_impact' not in ss:
+            ss.generating_citizen_impact = False
     
     def _sanitize_html_content(self, content: str) -> str:
         """Sanitize content for safe HTML display"""
         if not content:
             return ""
-        # Escape HTML special characters to prevent XSS
-        return html.escape(content)
+        # Escape HTML special characters to prevent XSS (only if any are present)
+        return content if _ESCAPE_NEEDED.search(content) is None else html.escape(content)
     
     def render_markdown_content(self, content: str, content_type: str = "Content", expanded: bool = False) -> None:
         """Render content with proper markdown formatting in an eye-friendly manner"""
@@ -57,10 +224,10 @@ class SummaryDisplayManager:
             else:
                 # For longer content, show preview first then expandable full content
                 if len(content) > 500:
-                    # Show preview
-                    preview = content[:300] + "..." if len(content) > 300 else content
-                    st.markdown(f"**Preview:**")
-                    st.markdown(f"```\n{preview}\n```")
+                    # Show preview (st.code skips the markdown pipeline, and a ``` inside
+                    # the content can no longer close the fence early)
+                    st.markdown("**Preview:**")
+                    st.code(content[:300] + "...", language=None)
                     
                     # Full content in nested expander
                     with st.expander("📖 View Full Content", expanded=False):
@@ -68,7 +235,7 @@ class SummaryDisplayManager:
                             f"{content_type} Content",
                             value=content,
                             height=400,
-                            key=f"content_{content_type.lower().replace(' ', '_')}_{hash(content) % 10000}",
+                            key=f"content_{content_type.lower().replace(' ', '_')}_{_content_key(content)}",
                             help=f"Complete {content_type.lower()} content",
                             disabled=True
                         )
@@ -77,114 +244,62 @@ class SummaryDisplayManager:
                     st.text_area(
                         f"{content_type} Content",
                         value=content,
-                        height=min(300, len(content.split('\n')) * 20 + 50),
-                        key=f"content_{content_type.lower().replace(' ', '_')}_{hash(content) % 10000}",
+                        height=min(300, (content.count('\n') + 1) * 20 + 50),
+                        key=f"content_{content_type.lower().replace(' ', '_')}_{_content_key(content)}",
                         help=f"Generated {content_type.lower()} content",
                         disabled=True
                     )
     
-    def _is_markdown_content(self, content: str) -> bool:
-        """Check if content appears to be markdown formatted"""
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def _is_markdown_content(content: str) -> bool:
+        """Check if content appears to be markdown formatted (memoized - the same
+        summary is checked again on every rerun and by several render paths)"""
         if not content:
             return False
         
-        # Look for common markdown patterns
-        markdown_indicators = [
-            '# ',       # Headers
-            '## ',      # Subheaders
-            '### ',     # Sub-subheaders
-            '**',       # Bold
-            '*',        # Italic (but not too common to avoid false positives)
-            '- ',       # Lists
-            '1. ',      # Numbered lists
-            '`',        # Code
-            '```',      # Code blocks
-            '[',        # Links
-            '|',        # Tables
-        ]
-        
-        # Count markdown indicators
-        indicator_count = sum(1 for indicator in markdown_indicators if indicator in content)
-        
-        # If we find multiple indicators, it's likely markdown
-        return indicator_count >= 2
+        # Collect distinct markdown indicators; stop as soon as two are found,
+        # since multiple indicators mean it's likely markdown
+        found = set()
+        for match in _MD_HINTS.finditer(content):
+            found |= _MD_HINT_IMPLIES[match.group()]
+            if len(found) >= 2:
+                return True
+        return False
     
     def _display_author_info(self, document: Dict[str, Any]):
         """Display author information in a consistent format"""
         if not document:
             return
         
-        # Extract author information from different possible fields
-        authors = []
-        
-        # Try urheber field first
-        urheber = document.get('urheber', [])
-        if urheber and isinstance(urheber, list):
-            for urh in urheber:
-                if isinstance(urh, dict):
-                    bezeichnung = urh.get('bezeichnung', '')
-                    if bezeichnung:
-                        authors.append(bezeichnung)
-        
-        # Try autoren_anzeige field
+        # PERFORMANCE: Single lazy pass - only the first 3 names are materialized,
+        # the rest are just counted; autoren_anzeige is only scanned as a fallback
+        names = _iter_author_names(document.get('urheber'), 'bezeichnung')
+        authors = list(islice(names, 3))
         if not authors:
-            autoren_anzeige = document.get('autoren_anzeige', [])
-            if autoren_anzeige and isinstance(autoren_anzeige, list):
-                for author in autoren_anzeige:
-                    if isinstance(author, dict):
-                        autor_titel = author.get('autor_titel', '')
-                        if autor_titel:
-                            authors.append(autor_titel)
+            names = _iter_author_names(document.get('autoren_anzeige'), 'autor_titel')
+            authors = list(islice(names, 3))
         
         # Display author information if found
         if authors:
-            authors_text = ", ".join(authors[:3])  # Limit to first 3 authors
-            if len(authors) > 3:
-                authors_text += f" (+{len(authors) - 3} more)"
+            authors_text = ", ".join(authors)  # Limit to first 3 authors
+            remaining = sum(1 for _ in names)
+            if remaining:
+                authors_text += f" (+{remaining} more)"
             
-            st.markdown(f"""
-            <div style="
-                background: #e3f2fd;
-                border-left: 3px solid #1976d2;
-                padding: 8px 12px;
-                border-radius: 3px;
-                margin: 8px 0;
-                font-size: 13px;
-                color: #1565c0;
-            ">
-                📝 <strong>Author(s):</strong> {authors_text}
-            </div>
-            """, unsafe_allow_html=True)
+            # Author names come from the API and are rendered as raw HTML - escape them
+            st.markdown(
+                "".join((_AUTHOR_PREFIX, self._sanitize_html_content(authors_text), _AUTHOR_SUFFIX)),
+                unsafe_allow_html=True
+            )
     
     def create_streaming_display_placeholders(self, num_documents: int, doc_type: str) -> Dict[str, Any]:
         """Create placeholders for streaming display of multiple document summaries"""
         
-        # Custom styled header for streaming mode
-        st.markdown(f"""
-        <div style="
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            padding: 20px;
-            border-radius: 12px;
-            margin: 20px 0;
-            text-align: center;
-            box-shadow: 0 4px 6px rgba(0,0,0,0.1);
-        ">
-            <div style="
-                color: white;
-                font-size: 24px;
-                font-weight: bold;
-                margin-bottom: 8px;
-            ">
-                🤖 Processing Documents
-            </div>
-            <div style="
-                color: rgba(255,255,255,0.9);
-                font-size: 16px;
-            ">
-                Analyzing {num_documents} {doc_type} documents
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
+        # Custom styled header for streaming mode. It is emitted on every call on
+        # purpose: Streamlit removes elements a rerun does not re-emit, and an
+        # unchanged element is not re-sent to the frontend anyway
+        st.markdown(_stream_header_html(num_documents, doc_type), unsafe_allow_html=True)
         
         # Overall progress
         progress_bar = st.progress(0)
@@ -237,49 +352,22 @@ class SummaryDisplayManager:
         placeholders['progress_bar'].progress(progress)
         
         # Use custom styled progress message
-        placeholders['status_text'].markdown(f"""
-        <div style="
-            background: linear-gradient(135deg, #f0f4f8 0%, #e2e8f0 100%);
-            padding: 12px;
-            border-radius: 6px;
-            border-left: 3px solid #667eea;
-            margin: 5px 0;
-            box-shadow: 0 1px 3px rgba(0,0,0,0.1);
-        ">
-            <div style="
-                color: #2d3748;
-                font-weight: 500;
-                font-size: 14px;
-            ">
-                🔄 Processing {current}/{total}: {current_title[:60]}{"..." if len(current_title) > 60 else ""}
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
+        placeholders['status_text'].markdown("".join((
+            _PROGRESS_PREFIX,
+            f"{current}/{total}: {self._sanitize_html_content(current_title[:60])}",
+            "..." if len(current_title) > 60 else "",
+            _PROGRESS_SUFFIX
+        )), unsafe_allow_html=True)
     
     def complete_streaming_display(self, placeholders: Dict[str, Any], successful: int, total: int):
         """Complete the streaming display"""
         placeholders['progress_bar'].progress(1.0)
         
         # Use eye-friendly neutral completion message (no bright green)
-        placeholders['status_text'].markdown(f"""
-        <div style="
-            background: linear-gradient(135deg, #f8f9fa 0%, #e9ecef 100%);
-            padding: 15px;
-            border-radius: 8px;
-            border-left: 4px solid #6c757d;
-            margin: 10px 0;
-            text-align: center;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        ">
-            <div style="
-                color: #495057;
-                font-weight: bold;
-                font-size: 16px;
-            ">
-                ✅ Completed {successful}/{total} summaries successfully
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
+        placeholders['status_text'].markdown(
+            "".join((_COMPLETE_PREFIX, f"{successful}/{total}", _COMPLETE_SUFFIX)),
+            unsafe_allow_html=True
+        )
     
     def create_chunk_placeholders(self, doc_placeholder: Dict[str, Any], num_chunks: int) -> List[Any]:
         """Create organized placeholders for individual chunks with improved UX"""
@@ -291,13 +379,12 @@ class SummaryDisplayManager:
             
             # Create a collapsible section for all chunks
             with st.expander(f"🔍 **View Chunk Analysis** ({num_chunks} parts)", expanded=False):
-                # Create individual chunk placeholders within the main expander
+                # Create individual chunk placeholders within the main expander.
+                # PERFORMANCE: Each separator shares one markdown element with the
+                # following chunk header (2 elements per chunk instead of 3)
                 for i in range(num_chunks):
-                    st.markdown(f"#### 🧩 Chunk {i+1}")
-                    chunk_placeholder = st.empty()
-                    chunk_placeholders.append(chunk_placeholder)
-                    if i < num_chunks - 1:  # Add separator except for last chunk
-                        st.markdown("---")
+                    st.markdown(f"---\n#### 🧩 Chunk {i+1}" if i else "#### 🧩 Chunk 1")
+                    chunk_placeholders.append(st.empty())
         
         # Store chunk placeholders in the document placeholder
         doc_placeholder['chunk_placeholders'] = chunk_placeholders
@@ -319,7 +406,7 @@ class SummaryDisplayManager:
             return ""
         
         # Escape HTML to prevent XSS and keep it simple for performance
-        escaped_content = html.escape(content)
+        escaped_content = content if _ESCAPE_NEEDED.search(content) is None else content.translate(_HTML_TRANS)
         
         # Only convert double newlines to paragraphs for better performance
         # Single newlines become spaces to avoid excessive BR tags
@@ -340,7 +427,16 @@ class SummaryDisplayManager:
         if not content:
             return "Empty chunk"
         
-        # Clean the content for summary
+        # PERFORMANCE: Clean only a bounded head of the content; if it already yields
+        # more than max_length characters the rest of the content cannot matter
+        head_length = max_length + 64
+        clean_content = content[:head_length].replace('\n', ' ').strip()
+        if len(clean_content) > max_length:
+            return clean_content[:max_length] + "..."
+        if len(content) <= head_length:
+            return clean_content
+        
+        # Head was mostly whitespace - clean the full content
         clean_content = content.replace('\n', ' ').strip()
         
         # Return truncated version with ellipsis if too long
@@ -375,7 +471,7 @@ class SummaryDisplayManager:
                             value=content,
                             height=200,
                             disabled=True,
-                            key=f"chunk_{chunk_index}_{hash(content) % 10000}"
+                            key=f"chunk_{chunk_index}_{_content_key(content)}"
                         )
         else:
             # Show processing status with progress indicator
@@ -407,22 +503,26 @@ class SummaryDisplayManager:
     
     def show_summary_modal(self, summary_data: Dict[str, Any]):
         """Show summary in a modal dialog"""
-        st.session_state.show_summary_modal = True
-        st.session_state.modal_summary_data = summary_data
+        ss = st.session_state
+        ss.show_summary_modal = True
+        ss.modal_summary_data = summary_data
     
     def hide_summary_modal(self):
         """Hide the summary modal"""
-        st.session_state.show_summary_modal = False
-        st.session_state.modal_summary_data = None
+        ss = st.session_state
+        ss.show_summary_modal = False
+        ss.modal_summary_data = None
     
     def render_summary_modal(self):
         """Render the summary modal if it should be shown"""
-        if st.session_state.show_summary_modal and st.session_state.modal_summary_data:
+        ss = st.session_state
+        if ss.show_summary_modal and ss.modal_summary_data:
             self._render_modal_overlay()
     
     def _render_modal_overlay(self):
         """Render the modal overlay with summary content"""
-        summary_data = st.session_state.modal_summary_data
+        ss = st.session_state
+        summary_data = ss.modal_summary_data
         document = summary_data.get('document', {})
         summary = summary_data.get('summary', '')
         full_text = summary_data.get('full_text', '')
@@ -470,19 +570,26 @@ class SummaryDisplayManager:
             with col2:
                 # Get citizen impact for combined download
                 doc_id = document.get('id', 'unknown')
-                citizen_impact_data = st.session_state.citizen_impact_analysis.get(doc_id, {})
+                citizen_impact_data = ss.citizen_impact_analysis.get(doc_id, {})
                 citizen_impact = citizen_impact_data.get('analysis', '')
                 
-                combined_data = {
-                    'document_info': document,
-                    'ai_summary': summary,
-                    'citizen_impact_analysis': citizen_impact,
-                    'full_text': full_text,
-                    'generated_at': summary_data.get('timestamp', '')
-                }
+                # PERFORMANCE: download_button evaluates data on every rerun - serialize
+                # (possibly megabytes of full text) once per summary/analysis version in a
+                # bounded st.cache_data entry rather than a per-session copy in session_state
+                generated_at = summary_data.get('timestamp', '')
+                payload = _download_payload(
+                    doc_id, _content_key(summary), _content_key(citizen_impact), generated_at,
+                    {
+                        'document_info': document,
+                        'ai_summary': summary,
+                        'citizen_impact_analysis': citizen_impact,
+                        'full_text': full_text,
+                        'generated_at': generated_at
+                    }
+                )
                 st.download_button(
                     label="📦 Download All",
-                    data=json.dumps(combined_data, indent=2, ensure_ascii=False),
+                    data=payload,
                     file_name=f"complete_data_{document.get('id', 'unknown')}.json",
                     mime="application/json",
                     key="modal_download_complete",
@@ -496,7 +603,7 @@ class SummaryDisplayManager:
         with tab2:
             # Citizen Impact Analysis Tab
             doc_id = document.get('id', 'unknown')
-            citizen_impact = st.session_state.citizen_impact_analysis.get(doc_id)
+            citizen_impact = ss.citizen_impact_analysis.get(doc_id)
             
             if citizen_impact and citizen_impact.get('analysis'):
                 st.markdown("### 🏛️ Citizen Impact Analysis")
@@ -568,10 +675,11 @@ class SummaryDisplayManager:
     
     def store_citizen_impact_analysis(self, doc_id: str, analysis: str):
         """Store citizen impact analysis in session state"""
-        if 'citizen_impact_analysis' not in st.session_state:
-            st.session_state.citizen_impact_analysis = {}
+        ss = st.session_state
+        if 'citizen_impact_analysis' not in ss:
+            ss.citizen_impact_analysis = {}
         
-        st.session_state.citizen_impact_analysis[doc_id] = {
+        ss.citizen_impact_analysis[doc_id] = {
             'analysis': analysis,
             'timestamp': datetime.now().isoformat()
         }
@@ -634,14 +742,12 @@ class SummaryDisplayManager:
 class AnalyticsDisplayManager:
     """Manages analytics and visualization components"""
     
-    def __init__(self):
-        pass
-    
     def display_summary_analytics(self, document_summaries: Dict[str, Any]):
         """Display analytics for summaries"""
         if not document_summaries:
             st.info("No summaries available for analytics.")
             return
+        px = _get_px()
         
         st.subheader("📊 Summary Analytics")
         
@@ -731,6 +837,7 @@ class AnalyticsDisplayManager:
     
     def _plot_drucksache_analytics(self, documents: List[Dict[str, Any]]):
         """Create analytics plots for Drucksachen"""
+        px = _get_px()
         col1, col2 = st.columns(2)
         
         with col1:
@@ -770,6 +877,7 @@ class AnalyticsDisplayManager:
     
     def _plot_vorgang_analytics(self, documents: List[Dict[str, Any]]):
         """Create analytics plots for Vorgänge"""
+        px = _get_px()
         col1, col2 = st.columns(2)
         
         with col1: